@@ -5,15 +5,37 @@ This module contains the ImportExportManager class that manages the import and e
 of questions in JSON format.
 """
 
+import functools
+import itertools
 import json
+import operator
 import os
 import re
-import uuid
+import secrets
 from datetime import datetime
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Set, Tuple
 import logging
 import shutil
-from fuzzywuzzy import fuzz
+from concurrent.futures import Future, ThreadPoolExecutor
+from rapidfuzz import fuzz, process
+from rapidfuzz.utils import default_process
+
+# Optional streaming JSON parser for large import files
+try:
+    import ijson
+    HAS_IJSON = True
+    # The C backends parse as fast as json.load, so every import can be streamed
+    HAS_FAST_IJSON = ijson.backend in ('yajl2_c', 'yajl2_cffi')
+except ImportError:
+    HAS_IJSON = False
+    HAS_FAST_IJSON = False
+
+# Optional fast JSON library for exports and non-streamed imports
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 from sat_app.dal.models import Question
 from sat_app.dal.repositories import QuestionRepository
@@ -21,6 +43,133 @@ from sat_app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Image copies are I/O bound and release the GIL, so use more threads than cores
+_IMAGE_COPY_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Shared by every import and export batch so worker threads are started once
+# and reused; the pool only starts threads when copies are submitted
+_IMAGE_COPY_EXECUTOR = ThreadPoolExecutor(max_workers=_IMAGE_COPY_WORKERS,
+                                          thread_name_prefix='image-copy')
+
+# Copied images are named <prefix><counter>_<original name>; the random prefix
+# keeps names from different runs apart and the counter keeps them unique within one
+_IMAGE_NAME_PREFIX = secrets.token_hex(8)
+_image_name_counter = itertools.count()
+
+# Question fields that hold image paths, and a getter returning all of them at once
+_IMAGE_FIELDS = (
+    "question_image_path", "answer_image_a", "answer_image_b",
+    "answer_image_c", "answer_image_d"
+)
+_get_image_paths = operator.attrgetter(*_IMAGE_FIELDS)
+
+# Patterns used to normalize text for duplicate detection
+_LATEX_DOLLAR_PATTERN = re.compile(r'\$([^$]+)\$')
+_LATEX_COMMAND_PATTERN = re.compile(r'\\[a-zA-Z]+ ?')
+_BRACES_TABLE = str.maketrans('', '', '{}')
+_IMAGE_ANNOTATION_PATTERN = re.compile(
+    r'\(see (?:figure|image|table|diagram)[^)]*\)'
+    r'|\(figure \d+[^)]*\)'
+    r'|\(image [^)]*\)'
+    r'|as shown in the (?:figure|image|table|diagram)'
+)
+
+
+def _unique_image_name(image_path: str) -> str:
+    """
+    Build a unique file name for a copied image.
+    
+    Names combine a random per-process prefix with a counter, so they are
+    unique within the process and practically unique across runs without
+    reading random bytes for every image.
+    
+    Args:
+        image_path: Original image path
+        
+    Returns:
+        The original file name prefixed with a unique identifier
+    """
+    return f"{_IMAGE_NAME_PREFIX}{next(_image_name_counter):08x}_{os.path.basename(image_path)}"
+
+
+def _dumps_nested(obj: Any, indent: Optional[int], level: int) -> bytes:
+    """
+    Serialize an object as JSON nested ``level`` levels deep in a document.
+    
+    Uses orjson when it is installed and it supports the requested layout
+    (compact or 2-space indentation). Newlines inside strings are always
+    escaped in JSON, so every raw newline in indented output starts a new
+    line that needs the extra indentation.
+    
+    Args:
+        obj: Object to serialize
+        indent: Number of spaces per indentation level, or None for compact output
+        level: Nesting level of the object in the enclosing document
+        
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if indent is None:
+        if HAS_ORJSON:
+            return orjson.dumps(obj)
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+    
+    if HAS_ORJSON and indent == 2:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(obj, indent=indent).encode('utf-8')
+    return data.replace(b'\n', b'\n' + b' ' * (indent * level))
+
+
+def _dumps_line(obj: Any) -> bytes:
+    """
+    Serialize an object as one line of compact JSON for NDJSON files.
+    
+    Args:
+        obj: Object to serialize
+        
+    Returns:
+        UTF-8 encoded JSON followed by a newline
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(obj) + b'\n'
+    return json.dumps(obj).encode('utf-8') + b'\n'
+
+
+@functools.lru_cache(maxsize=16384)
+def _normalize_text(text: str) -> str:
+    """
+    Normalize a string for fuzzy comparison.
+    
+    Results are cached because the same question and answer texts are
+    normalized again on every import run and for repeated answer choices.
+    
+    Args:
+        text: Text to normalize
+        
+    Returns:
+        Normalized text for comparison
+    """
+    # Convert to lowercase
+    normalized = text.lower()
+    
+    # Remove common LaTeX delimiters and commands but keep the content. The
+    # substring checks skip the regex engine for plain text.
+    if '$' in normalized:
+        normalized = _LATEX_DOLLAR_PATTERN.sub(r'\1', normalized)  # Remove $ delimiters
+    if '\\' in normalized:
+        normalized = _LATEX_COMMAND_PATTERN.sub('', normalized)    # Remove LaTeX commands like \sqrt, \frac
+    normalized = normalized.translate(_BRACES_TABLE)               # Remove braces
+    
+    # Remove common image annotation patterns in a single pass
+    if '(' in normalized or 'as shown' in normalized:
+        normalized = _IMAGE_ANNOTATION_PATTERN.sub('', normalized)
+    
+    # Clean up whitespace
+    normalized = ' '.join(normalized.split())
+    
+    return normalized.strip()
+
 
 class ImportExportManager:
     """
@@ -33,6 +182,18 @@ class ImportExportManager:
     - Handle associated images during import/export
     """
     
+    # Number of accepted questions whose images are copied and rows inserted together
+    IMPORT_BATCH_SIZE = 500
+    
+    # Number of questions converted, image-copied and written per export batch
+    EXPORT_BATCH_SIZE = 500
+    
+    # Import and export files with these extensions use NDJSON instead of a JSON document
+    NDJSON_EXTENSIONS = ('.ndjson', '.jsonl')
+    
+    # With ijson's pure-Python backend, only import files at least this large are streamed
+    STREAMING_THRESHOLD_BYTES = 10 * 1024 * 1024
+    
     SCHEMA_FIELDS = {
         'required': [
             'question_text',
@@ -45,6 +206,19 @@ class ImportExportManager:
         ]
     }
     
+    # All fields accepted on import: schema fields plus system fields
+    ALLOWED_FIELDS = frozenset(
+        SCHEMA_FIELDS['required'] +
+        SCHEMA_FIELDS['optional'] +
+        ['question_id', 'created_at', 'updated_at']
+    )
+    
+    REQUIRED_FIELDS = tuple(SCHEMA_FIELDS['required'])
+    
+    VALID_ANSWERS = frozenset(['A', 'B', 'C', 'D'])
+    
+    QUESTION_TYPES = frozenset(['multiple_choice', 'free_response'])
+    
     def __init__(self, question_repository: QuestionRepository, 
                  image_base_path: str) -> None:
         """
@@ -60,52 +234,130 @@ class ImportExportManager:
     
     def export_questions(self, question_ids: List[int], 
                           export_path: str,
-                          include_images: bool = True) -> Tuple[bool, str]:
+                          include_images: bool = True,
+                          indent: Optional[int] = None) -> Tuple[bool, str]:
         """
-        Export questions to a JSON file.
+        Export questions to a JSON or NDJSON file.
         
         Args:
             question_ids: List of question IDs to export
             export_path: Path to the export file
             include_images: Whether to include images in the export
+            indent: Spaces per indentation level for human-readable JSON, or
+                None for compact output; ignored for NDJSON
             
         Returns:
             (success, message): Tuple indicating success and a message
         """
         try:
-            # Get all questions to be exported
+            # Get all questions to be exported, in the requested order
+            questions_by_id = self.question_repository.get_questions_by_ids(question_ids)
             questions = []
             for qid in question_ids:
-                question = self.question_repository.get_question(qid)
+                question = questions_by_id.get(qid)
                 if question:
                     questions.append(question)
                 else:
-                    self.logger.warning(f"Question with ID {qid} not found, skipping.")
-            
-            # Create dictionary with questions and metadata
-            export_data = {
-                "metadata": {
-                    "exported_at": datetime.now().isoformat(),
-                    "count": len(questions),
-                    "version": "1.0"
-                },
-                "questions": [q.to_dict() for q in questions]
+                    self.logger.warning("Question with ID %s not found, skipping.", qid)
+        
+        except Exception as e:
+            error_msg = f"Error during export: {str(e)}"
+            self.logger.error(error_msg, exc_info=True)
+            return False, error_msg
+        
+        return self._export_question_list(questions, export_path, include_images, indent)
+    
+    def _export_question_list(self, questions: List[Question],
+                              export_path: str,
+                              include_images: bool,
+                              indent: Optional[int] = None) -> Tuple[bool, str]:
+        """
+        Write already loaded questions to a JSON or NDJSON export file.
+        
+        Paths ending in one of NDJSON_EXTENSIONS are written as NDJSON.
+        
+        Args:
+            questions: Questions to export
+            export_path: Path to the export file
+            include_images: Whether to include images in the export
+            indent: Spaces per indentation level for human-readable JSON, or
+                None for compact output; ignored for NDJSON
+            
+        Returns:
+            (success, message): Tuple indicating success and a message
+        """
+        try:
+            metadata = {
+                "exported_at": datetime.now().isoformat(),
+                "count": len(questions),
+                "version": "1.0"
             }
             
-            # Create a directory for images if needed
-            if include_images and any(self._has_images(q) for q in questions):
-                export_dir = os.path.dirname(export_path)
-                images_dir = os.path.join(export_dir, 'images')
-                os.makedirs(images_dir, exist_ok=True)
-                
-                # Copy images and update paths in the export data
-                for i, question_dict in enumerate(export_data["questions"]):
-                    question = questions[i]
-                    self._process_images_for_export(question_dict, question, images_dir)
+            # Questions are written in batches so only one batch of export
+            # dictionaries is held in memory. JSON output matches a dump of the
+            # whole {"metadata": ..., "questions": [...]} document with the
+            # requested indentation; NDJSON output has a {"metadata": ...} line
+            # and then one line per question
+            ndjson = self._is_ndjson_path(export_path)
+            if indent is None:
+                newline, item_newline, separator = b'', b'', b','
+            else:
+                newline = b'\n' + b' ' * indent
+                item_newline = b'\n' + b' ' * (2 * indent)
+                separator = b',' + item_newline
+            first_separator = item_newline
             
-            # Write to JSON file
-            with open(export_path, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, indent=2)
+            # Create the export folder up front; the images folder inside it is
+            # only created once an image is found
+            export_dir = os.path.dirname(export_path)
+            os.makedirs(export_dir or '.', exist_ok=True)
+            images_dir = os.path.join(export_dir, 'images')
+            images_dir_created = False
+            
+            # Each source image is copied once per export, however many
+            # questions or fields reference it
+            exported_names: Dict[str, str] = {}
+            copies_by_destination: Dict[str, Future] = {}
+            with open(export_path, 'wb') as f:
+                if ndjson:
+                    f.write(_dumps_line({"metadata": metadata}))
+                else:
+                    key_separator = b':' if indent is None else b': '
+                    f.write(b'{' + newline + b'"metadata"' + key_separator +
+                            _dumps_nested(metadata, indent, 1) + b',' +
+                            newline + b'"questions"' + key_separator + b'[')
+                
+                for start in range(0, len(questions), self.EXPORT_BATCH_SIZE):
+                    batch = questions[start:start + self.EXPORT_BATCH_SIZE]
+                    question_dicts = [q.to_dict() for q in batch]
+                    
+                    # Copy images and update paths in the export data
+                    if include_images:
+                        copy_jobs = []
+                        for question_dict, question in zip(question_dicts, batch):
+                            copy_jobs.extend(
+                                self._process_images_for_export(question_dict, question, images_dir,
+                                                                exported_names)
+                            )
+                        
+                        # Create the images directory once the first image is found
+                        if copy_jobs and not images_dir_created:
+                            os.makedirs(images_dir, exist_ok=True)
+                            images_dir_created = True
+                        
+                        self._copy_images(copy_jobs, "Error copying image", keep_original_on_error=True,
+                                          copies_by_destination=copies_by_destination)
+                    
+                    for question_dict in question_dicts:
+                        if ndjson:
+                            f.write(_dumps_line(question_dict))
+                        else:
+                            f.write(first_separator + _dumps_nested(question_dict, indent, 2))
+                            first_separator = separator
+                
+                if not ndjson:
+                    closing_newline = b'' if indent is None else b'\n'
+                    f.write((newline if questions else b'') + b']' + closing_newline + b'}')
             
             return True, f"Successfully exported {len(questions)} questions to {export_path}"
         
@@ -117,7 +369,7 @@ class ImportExportManager:
     def import_questions(self, import_path: str, 
                          import_images: bool = True) -> Tuple[bool, str, Dict[str, int]]:
         """
-        Import questions from a JSON file.
+        Import questions from a JSON or NDJSON file.
         
         Args:
             import_path: Path to the import file
@@ -135,45 +387,72 @@ class ImportExportManager:
         }
         
         try:
-            # Read and parse JSON file
-            with open(import_path, 'r', encoding='utf-8') as f:
-                import_data = json.load(f)
+            # Read and parse JSON file; the whole file is checked before any
+            # question is imported, so a malformed file imports nothing
+            import_format = {"valid": False}
+            question_dicts = self._read_import_questions(import_path, import_format)
             
-            if not isinstance(import_data, dict) or "questions" not in import_data:
+            if not import_format["valid"]:
                 return False, "Invalid import format: missing 'questions' array", stats
             
-            question_dicts = import_data.get("questions", [])
-            stats["total"] = len(question_dicts)
+            # Imported images only ever go to these two directories
+            if import_images:
+                for image_type in ("questions", "answers"):
+                    os.makedirs(os.path.join(self.image_base_path, image_type), exist_ok=True)
+            
+            # Build the duplicate index once for the whole import run
+            duplicate_index = self._build_duplicate_index()
+            existing_signatures, exact_signatures = duplicate_index
+            
+            # Accepted questions (with their comparison keys) waiting for their
+            # images to be copied and rows inserted, and the previous batch
+            # whose images are still copying
+            pending = []
+            in_flight = None
             
             # Process each question
             for q_dict in question_dicts:
+                stats["total"] += 1
                 try:
                     # Validate schema
                     validation_result, validation_msg = self._validate_question_schema(q_dict)
                     if not validation_result:
-                        self.logger.warning(f"Skipping invalid question: {validation_msg}")
+                        self.logger.warning("Skipping invalid question: %s", validation_msg)
                         stats["skipped"] += 1
                         continue
                     
                     # Check for duplicates using fuzzy matching
-                    if self._is_duplicate_question(q_dict):
-                        self.logger.info(f"Skipping duplicate question: {q_dict.get('question_text', '')[:50]}...")
+                    if self._is_duplicate_question(q_dict, existing_signatures, exact_signatures):
+                        self.logger.info("Skipping duplicate question: %.50s...", q_dict.get('question_text', ''))
                         stats["duplicates"] += 1
                         continue
                     
-                    # Process images if needed
-                    if import_images:
-                        self._process_images_for_import(q_dict, import_path)
+                    # Later rows in the same file must also be checked against this
+                    # one; the signature is removed again if the row is not added
+                    new_signature = self._get_comparison_key(self._get_question_signature(q_dict))
+                    if new_signature:
+                        existing_signatures.append(new_signature)
+                        exact_signatures.add(self._get_token_set_key(new_signature))
                     
-                    # Create and add question
-                    question = Question.from_dict(q_dict)
-                    self.question_repository.add_question(question)
-                    stats["imported"] += 1
+                    pending.append((q_dict, new_signature))
+                    if len(pending) >= self.IMPORT_BATCH_SIZE:
+                        started = self._start_pending_import(pending, import_path, import_images,
+                                                             stats, duplicate_index)
+                        if in_flight:
+                            self._finish_pending_import(in_flight, stats, duplicate_index)
+                        in_flight = started
+                        pending = []
                     
                 except Exception as e:
-                    self.logger.error(f"Error importing question: {str(e)}", exc_info=True)
+                    self.logger.error("Error importing question: %s", e, exc_info=True)
                     stats["errors"] += 1
             
+            started = self._start_pending_import(pending, import_path, import_images,
+                                                 stats, duplicate_index)
+            if in_flight:
+                self._finish_pending_import(in_flight, stats, duplicate_index)
+            self._finish_pending_import(started, stats, duplicate_index)
+            
             success_msg = (f"Import complete: {stats['imported']} imported, "
                           f"{stats['skipped']} skipped, {stats['duplicates']} duplicates, "
                           f"{stats['errors']} errors")
@@ -184,69 +463,338 @@ class ImportExportManager:
             self.logger.error(error_msg, exc_info=True)
             return False, error_msg, stats
     
-    def _has_images(self, question: Question) -> bool:
-        """Check if a question has any associated images."""
-        return any([
-            question.question_image_path,
-            question.answer_image_a,
-            question.answer_image_b,
-            question.answer_image_c,
-            question.answer_image_d
-        ])
+    def _read_import_questions(self, import_path: str,
+                               import_format: Dict[str, bool]) -> Iterable[Dict[str, Any]]:
+        """
+        Read the question dictionaries from an import file.
+        
+        NDJSON files are read line by line. JSON files are streamed with ijson
+        when it is installed, so only one question is held in memory at a time.
+        With ijson's slower pure-Python backend, or without ijson, small files
+        are parsed in one go instead, using orjson when it is installed.
+        
+        Streamed and NDJSON files are parsed once up front without keeping the
+        questions, so on every path a malformed file raises here, before any
+        question is imported.
+        
+        Args:
+            import_path: Path to the import file
+            import_format: Dictionary whose 'valid' entry is set to True if the
+                file has a top-level 'questions' array (or an NDJSON line)
+            
+        Returns:
+            An iterable of question dictionaries
+        """
+        if self._is_ndjson_path(import_path):
+            read_questions = self._read_ndjson_questions
+        elif HAS_FAST_IJSON or (HAS_IJSON and
+                                os.path.getsize(import_path) >= self.STREAMING_THRESHOLD_BYTES):
+            read_questions = self._stream_import_questions
+        else:
+            read_questions = None
+        
+        if read_questions:
+            for _ in read_questions(import_path, import_format):
+                pass
+            return read_questions(import_path, import_format)
+        
+        if HAS_ORJSON:
+            with open(import_path, 'rb') as f:
+                import_data = orjson.loads(f.read())
+        else:
+            with open(import_path, 'r', encoding='utf-8') as f:
+                import_data = json.load(f)
+        
+        questions = import_data.get("questions") if isinstance(import_data, dict) else None
+        if not isinstance(questions, list):
+            return []
+        
+        import_format["valid"] = True
+        return questions
+    
+    def _read_ndjson_questions(self, import_path: str,
+                               import_format: Dict[str, bool]) -> Iterator[Dict[str, Any]]:
+        """
+        Read the question dictionaries of an NDJSON import file line by line.
+        
+        Blank lines and the {"metadata": ...} line written by exports are skipped.
+        
+        Args:
+            import_path: Path to the import file
+            import_format: Dictionary whose 'valid' entry is set to True once a
+                metadata line or question has been read
+            
+        Yields:
+            Question dictionaries in file order
+        """
+        with open(import_path, 'rb') as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                
+                try:
+                    data = orjson.loads(line) if HAS_ORJSON else json.loads(line)
+                except ValueError as e:
+                    raise ValueError(f"Invalid JSON on line {line_number}: {str(e)}") from e
+                
+                import_format["valid"] = True
+                if isinstance(data, dict) and data.keys() == {"metadata"}:
+                    continue
+                
+                yield data
+    
+    def _stream_import_questions(self, import_path: str,
+                                 import_format: Dict[str, bool]) -> Iterator[Dict[str, Any]]:
+        """
+        Stream the question dictionaries of an import file with ijson.
+        
+        Args:
+            import_path: Path to the import file
+            import_format: Dictionary whose 'valid' entry is set to True once a
+                top-level 'questions' array has been found
+            
+        Yields:
+            Question dictionaries in file order
+        """
+        with open(import_path, 'rb') as f:
+            def parse_events():
+                for prefix, event, value in ijson.parse(f, use_float=True):
+                    if prefix == 'questions' and event == 'start_array':
+                        import_format["valid"] = True
+                    yield prefix, event, value
+            
+            yield from ijson.items(parse_events(), 'questions.item')
+    
+    def _start_pending_import(self, pending: List[Tuple[Dict[str, Any], str]], import_path: str,
+                              import_images: bool, stats: Dict[str, int],
+                              duplicate_index: Tuple[List[str], Set[str]]) -> Tuple[
+                                  List[Tuple[Dict[str, Any], str]],
+                                  List[Tuple[str, str, Dict[str, Any], str, str]],
+                                  List[Future]]:
+        """
+        Start copying the images for a batch of accepted questions.
+        
+        The copies run in the background while the next batch is validated;
+        _finish_pending_import waits for them and adds the batch to the database.
+        
+        Args:
+            pending: Validated, non-duplicate question dictionaries with their
+                comparison keys
+            import_path: Path to the import file
+            import_images: Whether to import related images
+            stats: Import statistics to update
+            duplicate_index: Index from _build_duplicate_index; questions that
+                fail here are removed from it
+            
+        Returns:
+            (pending, copy_jobs, copies): The questions whose images could be
+            planned, their copy jobs and the futures of the running copies
+        """
+        copy_jobs = []
+        if import_images:
+            ready = []
+            for q_dict, signature in pending:
+                try:
+                    copy_jobs.extend(self._process_images_for_import(q_dict, import_path))
+                    ready.append((q_dict, signature))
+                except Exception as e:
+                    self.logger.error("Error importing question: %s", e, exc_info=True)
+                    stats["errors"] += 1
+                    self._remove_signature(signature, duplicate_index)
+            pending = ready
+        
+        return pending, copy_jobs, self._start_image_copies(copy_jobs)
+    
+    def _finish_pending_import(self, batch: Tuple[List[Tuple[Dict[str, Any], str]],
+                                                  List[Tuple[str, str, Dict[str, Any], str, str]],
+                                                  List[Future]],
+                               stats: Dict[str, int],
+                               duplicate_index: Tuple[List[str], Set[str]]) -> None:
+        """
+        Wait for a batch's image copies and add its questions to the database.
+        
+        The batch is inserted in a single transaction. If that fails, its
+        questions are inserted one at a time so only the rows that cannot be
+        added are counted as errors.
+        
+        Args:
+            batch: Batch returned by _start_pending_import
+            stats: Import statistics to update
+            duplicate_index: Index from _build_duplicate_index; questions that
+                are not added are removed from it
+        """
+        pending, copy_jobs, copies = batch
+        self._finish_image_copies(copy_jobs, copies, "Error importing image",
+                                  keep_original_on_error=False)
+        
+        # Create the questions and add the whole batch in one transaction
+        questions = []
+        signatures = []
+        for q_dict, signature in pending:
+            try:
+                questions.append(Question.from_dict(q_dict))
+                signatures.append(signature)
+            except Exception as e:
+                self.logger.error("Error importing question: %s", e, exc_info=True)
+                stats["errors"] += 1
+                self._remove_signature(signature, duplicate_index)
+        
+        if not questions:
+            return
+        
+        added = self.question_repository.add_questions(questions)
+        if added:
+            stats["imported"] += added
+            return
+        
+        self.logger.warning("Error adding a batch of %d imported questions, retrying one at a time",
+                            len(questions))
+        for question, signature in zip(questions, signatures):
+            if self.question_repository.add_question(question):
+                stats["imported"] += 1
+            else:
+                self.logger.error("Error adding imported question: %.50s...", question.question_text)
+                stats["errors"] += 1
+                self._remove_signature(signature, duplicate_index)
+    
+    def _copy_images(self, copy_jobs: List[Tuple[str, str, Dict[str, Any], str, str]],
+                     error_message: str, keep_original_on_error: bool,
+                     copies_by_destination: Optional[Dict[str, Future]] = None) -> None:
+        """
+        Copy image files concurrently and update the question dictionaries.
+        
+        Args:
+            copy_jobs: (source, destination, question_dict, field, new_path) tuples
+            error_message: Prefix for the error logged when a copy fails
+            keep_original_on_error: Keep the original path when a copy fails
+                instead of clearing the field
+            copies_by_destination: Copies already started, by destination path
+                (see _start_image_copies)
+        """
+        copies = self._start_image_copies(copy_jobs, copies_by_destination)
+        self._finish_image_copies(copy_jobs, copies, error_message, keep_original_on_error)
+    
+    def _start_image_copies(self, copy_jobs: List[Tuple[str, str, Dict[str, Any], str, str]],
+                            copies_by_destination: Optional[Dict[str, Future]] = None) -> List[Future]:
+        """
+        Submit image copies to the shared copy thread pool.
+        
+        Jobs with the same destination share one copy. Passing the same
+        copies_by_destination dictionary for several batches extends that
+        to copies started by earlier batches.
+        
+        Args:
+            copy_jobs: (source, destination, question_dict, field, new_path) tuples
+            copies_by_destination: Copies already started, by destination path;
+                updated with the copies started here
+            
+        Returns:
+            One future per copy job
+        """
+        if copies_by_destination is None:
+            copies_by_destination = {}
+        
+        copies = []
+        for job in copy_jobs:
+            copy = copies_by_destination.get(job[1])
+            if copy is None:
+                copy = _IMAGE_COPY_EXECUTOR.submit(shutil.copy2, job[0], job[1])
+                copies_by_destination[job[1]] = copy
+            copies.append(copy)
+        return copies
+    
+    def _finish_image_copies(self, copy_jobs: List[Tuple[str, str, Dict[str, Any], str, str]],
+                             copies: List[Future], error_message: str,
+                             keep_original_on_error: bool) -> None:
+        """
+        Wait for image copies and update the question dictionaries.
+        
+        Args:
+            copy_jobs: (source, destination, question_dict, field, new_path) tuples
+            copies: Futures returned by _start_image_copies for copy_jobs
+            error_message: Prefix for the error logged when a copy fails
+            keep_original_on_error: Keep the original path when a copy fails
+                instead of clearing the field
+        """
+        for (_, _, question_dict, field, new_path), copy in zip(copy_jobs, copies):
+            try:
+                copy.result()
+                question_dict[field] = new_path
+            except Exception as e:
+                original_path = question_dict.get(field)
+                self.logger.error("%s %s: %s", error_message, original_path, e)
+                if not keep_original_on_error:
+                    question_dict[field] = None
     
     def _process_images_for_export(self, question_dict: Dict[str, Any], 
-                                 question: Question, images_dir: str) -> None:
+                                 question: Question,
+                                 images_dir: str,
+                                 exported_names: Optional[Dict[str, str]] = None
+                                 ) -> List[Tuple[str, str, Dict[str, Any], str, str]]:
         """
-        Process and copy images for export.
+        Plan the image copies for an exported question.
         
         Args:
             question_dict: Question dictionary for export
             question: Original Question object
             images_dir: Directory to save exported images
+            exported_names: Exported file names by source path; a source that
+                is already in it reuses its name, so repeated references to
+                one image produce jobs with the same destination
+            
+        Returns:
+            Copy jobs for _copy_images; each path in the export dict is updated
+            to be relative to the export file once its copy succeeds
         """
-        image_fields = [
-            "question_image_path", "answer_image_a", "answer_image_b",
-            "answer_image_c", "answer_image_d"
-        ]
+        # Generated names are always relative, so they can be appended to
+        # precomputed directory prefixes instead of going through os.path.join.
+        # Stored image paths may be absolute and still need os.path.join.
+        images_prefix = os.path.join(images_dir, '')
+        relative_prefix = os.path.join('images', '')
         
-        for field in image_fields:
-            image_path = getattr(question, field, None)
+        copy_jobs = []
+        for field, image_path in zip(_IMAGE_FIELDS, _get_image_paths(question)):
             if not image_path:
                 continue
                 
+            full_original_path = os.path.join(self.image_base_path, image_path)
+            
             # Create a unique filename for the exported image
-            original_name = os.path.basename(image_path)
-            unique_name = f"{uuid.uuid4().hex}_{original_name}"
-            export_image_path = os.path.join(images_dir, unique_name)
+            if exported_names is None:
+                unique_name = _unique_image_name(image_path)
+            else:
+                unique_name = exported_names.get(full_original_path)
+                if unique_name is None:
+                    unique_name = _unique_image_name(image_path)
+                    exported_names[full_original_path] = unique_name
             
-            # Copy the image file
-            try:
-                full_original_path = os.path.join(self.image_base_path, image_path)
-                shutil.copy2(full_original_path, export_image_path)
-                
-                # Update the path in the export dict to be relative to the export file
-                question_dict[field] = os.path.join('images', unique_name)
-            except Exception as e:
-                self.logger.error(f"Error copying image {image_path}: {str(e)}")
-                # Keep the original path if copy fails
+            copy_jobs.append((
+                full_original_path, images_prefix + unique_name,
+                question_dict, field, relative_prefix + unique_name
+            ))
+        
+        return copy_jobs
     
     def _process_images_for_import(self, question_dict: Dict[str, Any], 
-                                 import_path: str) -> None:
+                                 import_path: str) -> List[Tuple[str, str, Dict[str, Any], str, str]]:
         """
-        Process images during import.
+        Plan the image copies for an imported question.
+        
+        Missing images are cleared from the question dictionary immediately.
         
         Args:
             question_dict: Question dictionary being imported
             import_path: Path to the import file
+            
+        Returns:
+            Copy jobs for _copy_images; each path is updated to be relative to
+            the image base directory once its copy succeeds
         """
-        image_fields = [
-            "question_image_path", "answer_image_a", "answer_image_b",
-            "answer_image_c", "answer_image_d"
-        ]
-        
         import_dir = os.path.dirname(import_path)
+        base_prefix = os.path.join(self.image_base_path, '')
         
-        for field in image_fields:
+        copy_jobs = []
+        for field in _IMAGE_FIELDS:
             image_path = question_dict.get(field)
             if not image_path:
                 continue
@@ -255,28 +803,21 @@ class ImportExportManager:
             full_import_path = os.path.join(import_dir, image_path)
             
             if not os.path.exists(full_import_path):
-                self.logger.warning(f"Image not found: {full_import_path}")
+                self.logger.warning("Image not found: %s", full_import_path)
                 question_dict[field] = None
                 continue
                 
             # Create a destination path within our image structure
             image_type = "questions" if field == "question_image_path" else "answers"
-            filename = os.path.basename(image_path)
-            unique_name = f"{uuid.uuid4().hex}_{filename}"
-            dest_rel_path = os.path.join(image_type, unique_name)
-            dest_abs_path = os.path.join(self.image_base_path, dest_rel_path)
+            unique_name = _unique_image_name(image_path)
+            dest_rel_path = f"{image_type}{os.sep}{unique_name}"
             
-            # Ensure directory exists
-            os.makedirs(os.path.dirname(dest_abs_path), exist_ok=True)
-            
-            # Copy the image
-            try:
-                shutil.copy2(full_import_path, dest_abs_path)
-                # Update path to be relative to image base directory
-                question_dict[field] = dest_rel_path
-            except Exception as e:
-                self.logger.error(f"Error importing image {image_path}: {str(e)}")
-                question_dict[field] = None
+            copy_jobs.append((
+                full_import_path, base_prefix + dest_rel_path,
+                question_dict, field, dest_rel_path
+            ))
+        
+        return copy_jobs
     
     def _validate_question_schema(self, question_dict: Dict[str, Any]) -> Tuple[bool, str]:
         """
@@ -289,7 +830,7 @@ class ImportExportManager:
             (valid, message): Whether the question is valid and a message
         """
         # Check required fields
-        for field in self.SCHEMA_FIELDS['required']:
+        for field in self.REQUIRED_FIELDS:
             if field not in question_dict or question_dict[field] is None:
                 return False, f"Missing required field: {field}"
         
@@ -302,19 +843,12 @@ class ImportExportManager:
         
         # If question_type is not set, try to infer it from the data
         if question_type is None:
-            # Check if we have multiple choice answers (A, B, C, D)
-            has_multiple_choice_answers = any([
-                question_dict.get('answer_a'),
-                question_dict.get('answer_b'),
-                question_dict.get('answer_c'),
-                question_dict.get('answer_d')
-            ])
-            
             # If correct_answer is A, B, C, or D, it's likely multiple choice
-            if correct_answer and correct_answer in ['A', 'B', 'C', 'D']:
+            if isinstance(correct_answer, str) and correct_answer in self.VALID_ANSWERS:
                 question_type = 'multiple_choice'
-            # If we have multiple choice answers, assume multiple choice
-            elif has_multiple_choice_answers:
+            # If we have multiple choice answers (A, B, C, D), assume multiple choice
+            elif (question_dict.get('answer_a') or question_dict.get('answer_b') or
+                  question_dict.get('answer_c') or question_dict.get('answer_d')):
                 question_type = 'multiple_choice'
             # If correct_answer is not A-D format and no multiple choice answers, assume free response
             else:
@@ -322,34 +856,33 @@ class ImportExportManager:
                 
             # Update the question dict with the inferred type
             question_dict['question_type'] = question_type
-            self.logger.info(f"Auto-detected question_type as '{question_type}' for question: {question_dict.get('question_text', '')[:50]}...")
+            self.logger.info("Auto-detected question_type as '%s' for question: %.50s...",
+                             question_type, question_dict.get('question_text', ''))
         
         # Validate question_type
-        if question_type not in ['multiple_choice', 'free_response']:
+        if not isinstance(question_type, str) or question_type not in self.QUESTION_TYPES:
             return False, f"Invalid question_type: {question_type}. Must be 'multiple_choice' or 'free_response'."
         
         # Validate correct_answer based on question type
-        if question_type == 'multiple_choice':
-            # For multiple choice, correct_answer must be A, B, C, or D (if provided and not empty)
-            if correct_answer is not None and correct_answer.strip() != '' and correct_answer not in ['A', 'B', 'C', 'D']:
+        # For multiple choice, correct_answer must be A, B, C, or D (if provided and not empty).
+        # A valid letter is the common case and is settled by one set lookup.
+        if (question_type == 'multiple_choice' and correct_answer is not None
+                and correct_answer not in self.VALID_ANSWERS):
+            if correct_answer.strip() == '':
+                # Handle empty correct_answer - this is valid for import, can be set later
+                self.logger.info("Multiple choice question has empty correct_answer - this can be set later during editing.")
+            else:
                 # If we have a non-A-D answer but it's marked as multiple choice, suggest it might be free response
-                self.logger.warning(f"Question marked as multiple_choice but correct_answer is '{correct_answer}'. Consider changing question_type to 'free_response'.")
+                self.logger.warning("Question marked as multiple_choice but correct_answer is '%s'. Consider changing question_type to 'free_response'.", correct_answer)
                 return False, f"Invalid correct_answer for multiple_choice: {correct_answer}. Must be one of A, B, C, D. If this is a free response question, set question_type to 'free_response'."
-            elif correct_answer is not None and correct_answer.strip() == '':
-                # Handle empty correct_answer - this is valid for import, can be set later
-                self.logger.info(f"Multiple choice question has empty correct_answer - this can be set later during editing.")
         # For free_response, correct_answer can be any string or empty/null
         
-        # All fields should be in either required or optional
-        all_allowed_fields = (
-            self.SCHEMA_FIELDS['required'] + 
-            self.SCHEMA_FIELDS['optional'] + 
-            ['question_id', 'created_at', 'updated_at']  # System fields
-        )
-        
-        for field in question_dict:
-            if field not in all_allowed_fields:
-                return False, f"Unknown field: {field}"
+        # All fields should be in either required or optional. The subset test
+        # runs in C; the loop only runs to name the first unknown field.
+        if not self.ALLOWED_FIELDS.issuperset(question_dict):
+            for field in question_dict:
+                if field not in self.ALLOWED_FIELDS:
+                    return False, f"Unknown field: {field}"
         
         return True, "Valid"
     
@@ -392,10 +925,10 @@ class ImportExportManager:
                         # Handle lists and other structures
                         question_dict[field] = str(answer_value)
                         
-                    self.logger.info(f"Converted complex {field} data to string: {question_dict[field][:50]}...")
+                    self.logger.info("Converted complex %s data to string: %.50s...", field, question_dict[field])
                     
                 except Exception as e:
-                    self.logger.error(f"Error converting {field} data to string: {str(e)}")
+                    self.logger.error("Error converting %s data to string: %s", field, e)
                     question_dict[field] = "[Complex data - conversion failed]"
             
             # Ensure the field is a string
@@ -410,24 +943,27 @@ class ImportExportManager:
                     question_dict[field] = ""
     
     def export_all_questions(self, export_path: str, 
-                             include_images: bool = True) -> Tuple[bool, str]:
+                             include_images: bool = True,
+                             indent: Optional[int] = None) -> Tuple[bool, str]:
         """
-        Export all questions to a JSON file.
+        Export all questions to a JSON or NDJSON file.
         
         Args:
             export_path: Path to the export file
             include_images: Whether to include images in the export
+            indent: Spaces per indentation level for human-readable JSON, or
+                None for compact output; ignored for NDJSON
             
         Returns:
             (success, message): Tuple indicating success and a message
         """
         questions = self.question_repository.get_all_questions()
-        question_ids = [q.question_id for q in questions]
-        return self.export_questions(question_ids, export_path, include_images)
+        return self._export_question_list(questions, export_path, include_images, indent)
     
     def export_filtered_questions(self, filters: Dict[str, Any], 
                                   export_path: str,
-                                  include_images: bool = True) -> Tuple[bool, str]:
+                                  include_images: bool = True,
+                                  indent: Optional[int] = None) -> Tuple[bool, str]:
         """
         Export questions that match the given filters.
         
@@ -435,13 +971,18 @@ class ImportExportManager:
             filters: Dictionary of filters to apply
             export_path: Path to the export file
             include_images: Whether to include images in the export
+            indent: Spaces per indentation level for human-readable JSON, or
+                None for compact output; ignored for NDJSON
             
         Returns:
             (success, message): Tuple indicating success and a message
         """
         questions = self.question_repository.filter_questions(filters)
-        question_ids = [q.question_id for q in questions]
-        return self.export_questions(question_ids, export_path, include_images)
+        return self._export_question_list(questions, export_path, include_images, indent)
+    
+    def _is_ndjson_path(self, path: str) -> bool:
+        """Check if a file path names an NDJSON (one JSON document per line) file."""
+        return path.lower().endswith(self.NDJSON_EXTENSIONS)
     
     def _normalize_text_for_comparison(self, text: str) -> str:
         """
@@ -464,24 +1005,7 @@ class ImportExportManager:
             except Exception:
                 return ""
         
-        # Convert to lowercase
-        normalized = text.lower()
-        
-        # Remove common LaTeX delimiters and commands but keep the content
-        normalized = re.sub(r'\$([^$]+)\$', r'\1', normalized)  # Remove $ delimiters
-        normalized = re.sub(r'\\[a-zA-Z]+ ?', '', normalized)   # Remove LaTeX commands like \sqrt, \frac
-        normalized = re.sub(r'[{}]', '', normalized)            # Remove braces
-        
-        # Remove common image annotation patterns
-        normalized = re.sub(r'\(see (figure|image|table|diagram)[^)]*\)', '', normalized)
-        normalized = re.sub(r'\(figure \d+[^)]*\)', '', normalized)
-        normalized = re.sub(r'\(image [^)]*\)', '', normalized)
-        normalized = re.sub(r'as shown in the (figure|image|table|diagram)', '', normalized)
-        
-        # Clean up whitespace
-        normalized = ' '.join(normalized.split())
-        
-        return normalized.strip()
+        return _normalize_text(text)
     
     def _get_question_signature(self, question_dict: Dict[str, Any]) -> str:
         """
@@ -493,15 +1017,43 @@ class ImportExportManager:
         Returns:
             Normalized signature string for comparison
         """
-        # Normalize question text
-        question_text = self._normalize_text_for_comparison(
-            question_dict.get('question_text', '')
+        return self._build_signature(
+            question_dict.get('question_text', ''),
+            [question_dict.get(choice, '') for choice in ['answer_a', 'answer_b', 'answer_c', 'answer_d']]
         )
+    
+    def _get_model_signature(self, question: Question) -> str:
+        """
+        Create the signature of a Question without converting it to a dictionary.
+        
+        Args:
+            question: Question object
+            
+        Returns:
+            Normalized signature string for comparison
+        """
+        return self._build_signature(
+            question.question_text,
+            [question.answer_a, question.answer_b, question.answer_c, question.answer_d]
+        )
+    
+    def _build_signature(self, question_text: Any, answer_texts: List[Any]) -> str:
+        """
+        Combine normalized question text and answer choices into a signature.
+        
+        Args:
+            question_text: Raw question text
+            answer_texts: Raw answer choice texts
+            
+        Returns:
+            Normalized signature string for comparison
+        """
+        # Normalize question text
+        question_text = self._normalize_text_for_comparison(question_text)
         
         # Normalize and combine answer choices (if they exist)
         answers = []
-        for choice in ['answer_a', 'answer_b', 'answer_c', 'answer_d']:
-            answer_text = question_dict.get(choice, '')
+        for answer_text in answer_texts:
             if answer_text:  # Only include non-empty answers
                 normalized_answer = self._normalize_text_for_comparison(answer_text)
                 answers.append(normalized_answer)
@@ -514,52 +1066,156 @@ class ImportExportManager:
             # For open response questions
             return question_text
     
-    def _is_duplicate_question(self, question_dict: Dict[str, Any], 
+    def _get_comparison_key(self, signature: str) -> str:
+        """
+        Preprocess a question signature for fuzzy scoring.
+        
+        Signatures are run through rapidfuzz's default_process once here so
+        the scorer does not have to preprocess every existing signature again
+        for each imported question.
+        
+        Args:
+            signature: Signature from _get_question_signature or _get_model_signature
+            
+        Returns:
+            Preprocessed signature, empty if there is nothing to compare
+        """
+        return default_process(signature)
+    
+    def _get_token_set_key(self, signature: str) -> str:
+        """
+        Get an order-independent key for the tokens of a comparison key.
+        
+        Two comparison keys with the same token set always score 100 with
+        token_set_ratio, so equal token set keys identify duplicates exactly.
+        
+        Args:
+            signature: Comparison key from _get_comparison_key
+            
+        Returns:
+            The sorted, de-duplicated tokens joined by spaces
+        """
+        return ' '.join(sorted(set(signature.split())))
+    
+    def _build_duplicate_index(self) -> Tuple[List[str], Set[str]]:
+        """
+        Build the normalized signatures for all questions in the database.
+        
+        The index is built once per import run so that each imported question
+        is compared against precomputed signatures instead of reloading and
+        re-normalizing the whole question bank. Signatures are cached in the
+        questions table; only questions added or updated since the last import
+        are normalized here, and their signatures are stored for next time.
+        
+        Returns:
+            (signatures, exact_signatures): List of non-empty comparison keys for
+            fuzzy matching and a set of their token set keys for exact-match lookups
+        """
+        try:
+            cached_signatures = self.question_repository.get_cached_signatures()
+            uncached_questions = self.question_repository.get_questions_without_signature()
+        except Exception as e:
+            self.logger.error("Error loading questions for duplicate checking: %s", e, exc_info=True)
+            return [], set()
+        
+        new_signatures = [
+            (question.question_id, self._get_comparison_key(self._get_model_signature(question)))
+            for question in uncached_questions
+        ]
+        if new_signatures and not self.question_repository.update_signatures(new_signatures):
+            self.logger.warning("Could not cache question signatures for duplicate checking")
+        
+        # Signatures with the same token set are kept once so fuzzy matching
+        # never scores equivalent text twice
+        signatures = []
+        exact_signatures = set()
+        all_signatures = itertools.chain(cached_signatures, (signature for _, signature in new_signatures))
+        for signature in all_signatures:
+            if not signature:
+                continue
+            token_set_key = self._get_token_set_key(signature)
+            if token_set_key not in exact_signatures:
+                signatures.append(signature)
+                exact_signatures.add(token_set_key)
+        
+        return signatures, exact_signatures
+    
+    def _remove_signature(self, signature: str,
+                          duplicate_index: Tuple[List[str], Set[str]]) -> None:
+        """
+        Remove an imported question that was not added from the duplicate index.
+        
+        Args:
+            signature: Comparison key added to the index when the question was accepted
+            duplicate_index: Index from _build_duplicate_index
+        """
+        if not signature:
+            return
+        
+        # Accepted questions are never duplicates, so their token set key was
+        # not in the index before and can be discarded without affecting others
+        existing_signatures, exact_signatures = duplicate_index
+        existing_signatures.remove(signature)
+        exact_signatures.discard(self._get_token_set_key(signature))
+    
+    def _is_duplicate_question(self, question_dict: Dict[str, Any],
+                              existing_signatures: List[str],
+                              exact_signatures: Set[str],
                               similarity_threshold: int = 95) -> bool:
         """
-        Check if a question is a duplicate using fuzzy matching.
+        Check if a question is a duplicate using exact and fuzzy matching.
         
         Args:
             question_dict: Question dictionary to check
+            existing_signatures: Comparison keys of existing questions (see _build_duplicate_index)
+            exact_signatures: Set of their token set keys for exact-match lookups
             similarity_threshold: Minimum similarity score (0-100) to consider as duplicate
             
         Returns:
             True if question is likely a duplicate, False otherwise
         """
         try:
-            # Get all existing questions from database
-            existing_questions = self.question_repository.get_all_questions()
-            
-            if not existing_questions:
+            if not existing_signatures:
                 return False
             
             # Create signature for the new question
-            new_signature = self._get_question_signature(question_dict)
+            new_signature = self._get_comparison_key(self._get_question_signature(question_dict))
             
-            if not new_signature.strip():
+            if not new_signature:
                 return False
             
-            # Compare with existing questions
-            for existing_question in existing_questions:
-                existing_dict = existing_question.to_dict()
-                existing_signature = self._get_question_signature(existing_dict)
-                
-                if not existing_signature.strip():
-                    continue
-                
-                # Calculate similarity using token set ratio (handles word order differences)
-                similarity = fuzz.token_set_ratio(new_signature, existing_signature)
-                
-                if similarity >= similarity_threshold:
-                    self.logger.debug(
-                        f"Found duplicate with {similarity}% similarity: "
-                        f"'{new_signature[:50]}...' vs '{existing_signature[:50]}...'"
-                    )
-                    return True
+            # Signatures with the same token set score 100 with token_set_ratio,
+            # so they are duplicates without any fuzzy scoring
+            if self._get_token_set_key(new_signature) in exact_signatures:
+                self.logger.debug("Found exact duplicate: '%.50s...'", new_signature)
+                return True
+            
+            # Find the closest existing question in a single rapidfuzz call using
+            # token set ratio (handles word order differences). Scores below the
+            # cutoff are pruned early; rounding keeps the integer scores
+            # fuzzywuzzy used to return.
+            match = process.extractOne(
+                new_signature, existing_signatures,
+                scorer=fuzz.token_set_ratio,
+                score_cutoff=similarity_threshold - 0.5
+            )
+            
+            if match is None:
+                return False
+            
+            existing_signature, score, _ = match
+            similarity = round(score)
+            
+            if similarity >= similarity_threshold:
+                self.logger.debug(
+                    "Found duplicate with %d%% similarity: '%.50s...' vs '%.50s...'",
+                    similarity, new_signature, existing_signature
+                )
+                return True
             
             return False
             
         except Exception as e:
-            self.logger.error(f"Error during duplicate checking: {str(e)}", exc_info=True)
+            self.logger.error("Error during duplicate checking: %s", e, exc_info=True)
             # If there's an error, don't block the import - just log and continue
-            return False
\ No newline at end of file
+            return False
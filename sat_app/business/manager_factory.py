@@ -4,6 +4,7 @@ Provides centralized creation of manager instances.
 """
 import logging
 import os
+from functools import cached_property
 from typing import Dict, Any, Optional
 
 from ..dal.database_manager import DatabaseManager
@@ -22,7 +23,9 @@ class ManagerFactory:
     Factory for creating and caching business layer manager instances.
     
     Ensures that managers are properly initialized with their dependencies
-    and reused across the application.
+    and reused across the application. Each repository and manager is a
+    cached property, so it is created on first access and later accesses
+    are plain attribute loads; the get_* methods are kept for callers.
     """
     
     def __init__(self, db_manager: DatabaseManager, config: Dict[str, Any] = None, config_manager: ConfigManager = None):
@@ -38,8 +41,77 @@ class ManagerFactory:
         self.db_manager = db_manager
         self.config = config or {}
         self.config_manager = config_manager
-        self._repositories: Dict[str, Any] = {}
-        self._managers: Dict[str, Any] = {}
+    
+    @cached_property
+    def question_repository(self) -> QuestionRepository:
+        """The shared QuestionRepository instance."""
+        self.logger.debug("Created QuestionRepository instance")
+        return QuestionRepository(self.db_manager)
+    
+    @cached_property
+    def score_repository(self) -> ScoreRepository:
+        """The shared ScoreRepository instance."""
+        self.logger.debug("Created ScoreRepository instance")
+        return ScoreRepository(self.db_manager)
+    
+    @cached_property
+    def worksheet_repository(self) -> WorksheetRepository:
+        """The shared WorksheetRepository instance."""
+        self.logger.debug("Created WorksheetRepository instance")
+        return WorksheetRepository(self.db_manager)
+    
+    @cached_property
+    def question_manager(self) -> QuestionManager:
+        """The shared QuestionManager instance."""
+        self.logger.debug("Created QuestionManager instance")
+        return QuestionManager(self.question_repository)
+    
+    @cached_property
+    def worksheet_generator(self) -> WorksheetGenerator:
+        """The shared WorksheetGenerator instance."""
+        self.logger.debug("Created WorksheetGenerator instance")
+        return WorksheetGenerator(
+            self.question_repository,
+            self.worksheet_repository
+        )
+    
+    @cached_property
+    def scoring_service(self) -> ScoringService:
+        """The shared ScoringService instance."""
+        self.logger.debug("Created ScoringService instance")
+        return ScoringService(
+            self.score_repository,
+            self.question_repository,
+            self.worksheet_repository
+        )
+    
+    @cached_property
+    def import_export_manager(self) -> ImportExportManager:
+        """The shared ImportExportManager instance."""
+        # Get the image base path from configuration
+        # Default to data/images if not specified
+        image_base_path = self.config.get('image_base_path', 'data/images')
+        
+        # Make sure the path is absolute
+        if not os.path.isabs(image_base_path):
+            # If it's a relative path, make it absolute based on the current working directory
+            image_base_path = os.path.abspath(image_base_path)
+        
+        self.logger.debug(f"Created ImportExportManager instance with image path: {image_base_path}")
+        return ImportExportManager(
+            self.question_repository,
+            image_base_path
+        )
+    
+    @cached_property
+    def settings_manager(self) -> SettingsManager:
+        """The shared SettingsManager instance."""
+        # Check if we have a config manager
+        if not self.config_manager:
+            raise ValueError("ConfigManager is required to create SettingsManager")
+        
+        self.logger.debug("Created SettingsManager instance")
+        return SettingsManager(self.config_manager)
     
     def get_question_repository(self) -> QuestionRepository:
         """
@@ -48,11 +120,7 @@ class ManagerFactory:
         Returns:
             A QuestionRepository instance
         """
-        if 'question_repository' not in self._repositories:
-            self._repositories['question_repository'] = QuestionRepository(self.db_manager)
-            self.logger.debug("Created QuestionRepository instance")
-        
-        return self._repositories['question_repository']
+        return self.question_repository
     
     def get_score_repository(self) -> ScoreRepository:
         """
@@ -61,11 +129,7 @@ class ManagerFactory:
         Returns:
             A ScoreRepository instance
         """
-        if 'score_repository' not in self._repositories:
-            self._repositories['score_repository'] = ScoreRepository(self.db_manager)
-            self.logger.debug("Created ScoreRepository instance")
-        
-        return self._repositories['score_repository']
+        return self.score_repository
     
     def get_question_manager(self) -> QuestionManager:
         """
@@ -74,15 +138,7 @@ class ManagerFactory:
         Returns:
             A QuestionManager instance
         """
-        if 'question_manager' not in self._managers:
-            # Get or create the repository
-            question_repository = self.get_question_repository()
-            
-            # Create the manager with the repository
-            self._managers['question_manager'] = QuestionManager(question_repository)
-            self.logger.debug("Created QuestionManager instance")
-        
-        return self._managers['question_manager']
+        return self.question_manager
     
     def get_worksheet_repository(self) -> WorksheetRepository:
         """
@@ -91,12 +147,8 @@ class ManagerFactory:
         Returns:
             A WorksheetRepository instance
         """
-        if 'worksheet_repository' not in self._repositories:
-            self._repositories['worksheet_repository'] = WorksheetRepository(self.db_manager)
-            self.logger.debug("Created WorksheetRepository instance")
-        
-        return self._repositories['worksheet_repository']
-
+        return self.worksheet_repository
+    
     def get_worksheet_generator(self) -> WorksheetGenerator:
         """
         Get the WorksheetGenerator instance.
@@ -104,19 +156,7 @@ class ManagerFactory:
         Returns:
             A WorksheetGenerator instance
         """
-        if 'worksheet_generator' not in self._managers:
-            # Get or create the repositories
-            question_repository = self.get_question_repository()
-            worksheet_repository = self.get_worksheet_repository()
-            
-            # Create the generator with the repositories
-            self._managers['worksheet_generator'] = WorksheetGenerator(
-                question_repository, 
-                worksheet_repository
-            )
-            self.logger.debug("Created WorksheetGenerator instance")
-        
-        return self._managers['worksheet_generator']
+        return self.worksheet_generator
     
     def get_scoring_service(self) -> ScoringService:
         """
@@ -125,32 +165,8 @@ class ManagerFactory:
         Returns:
             A ScoringService instance
         """
-        if 'scoring_service' not in self._managers:
-            # Get or create the repositories
-            score_repository = self.get_score_repository()
-            question_repository = self.get_question_repository()
-            
-            # Get the worksheet repository if available
-            worksheet_repository = None
-            if 'worksheet_repository' in self._repositories:
-                worksheet_repository = self._repositories['worksheet_repository']
-            else:
-                # Create worksheet repository if needed
-                from ..dal.repositories import WorksheetRepository
-                worksheet_repository = WorksheetRepository(self.db_manager)
-                self._repositories['worksheet_repository'] = worksheet_repository
-                self.logger.debug("Created WorksheetRepository instance for ScoringService")
-            
-            # Create the service with the repositories
-            self._managers['scoring_service'] = ScoringService(
-                score_repository, 
-                question_repository,
-                worksheet_repository
-            )
-            self.logger.debug("Created ScoringService instance")
-        
-        return self._managers['scoring_service']
-        
+        return self.scoring_service
+    
     def get_import_export_manager(self) -> ImportExportManager:
         """
         Get the ImportExportManager instance.
@@ -158,28 +174,8 @@ class ManagerFactory:
         Returns:
             An ImportExportManager instance
         """
-        if 'import_export_manager' not in self._managers:
-            # Get or create the repository
-            question_repository = self.get_question_repository()
-            
-            # Get the image base path from configuration
-            # Default to data/images if not specified
-            image_base_path = self.config.get('image_base_path', 'data/images')
-            
-            # Make sure the path is absolute
-            if not os.path.isabs(image_base_path):
-                # If it's a relative path, make it absolute based on the current working directory
-                image_base_path = os.path.abspath(image_base_path)
-            
-            # Create the manager with the repository and image path
-            self._managers['import_export_manager'] = ImportExportManager(
-                question_repository,
-                image_base_path
-            )
-            self.logger.debug(f"Created ImportExportManager instance with image path: {image_base_path}")
-        
-        return self._managers['import_export_manager']
-        
+        return self.import_export_manager
+    
     def get_settings_manager(self) -> SettingsManager:
         """
         Get the SettingsManager instance.
@@ -187,13 +183,4 @@ class ManagerFactory:
         Returns:
             A SettingsManager instance
         """
-        if 'settings_manager' not in self._managers:
-            # Check if we have a config manager
-            if not self.config_manager:
-                raise ValueError("ConfigManager is required to create SettingsManager")
-            
-            # Create the manager with the config manager
-            self._managers['settings_manager'] = SettingsManager(self.config_manager)
-            self.logger.debug("Created SettingsManager instance")
-        
-        return self._managers['settings_manager']
\ No newline at end of file
+        return self.settings_manager
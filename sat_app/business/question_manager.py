@@ -2,9 +2,11 @@
 Question manager module for the SAT Question Bank application.
 Orchestrates the creation, update, and deletion of questions.
 """
+import copy
+import functools
 import logging
-from datetime import datetime
-from typing import List, Optional, Dict, Any
+from collections import OrderedDict
+from typing import Callable, List, Optional, Dict, Any, Tuple
 
 from ..dal.repositories import QuestionRepository
 from ..dal.models import Question
@@ -19,6 +21,31 @@ class QuestionManager:
     performs business validation, and interacts with the repository.
     """
     
+    # Maximum number of list and filter results kept in memory
+    LIST_CACHE_SIZE = 64
+    
+    # Maximum number of single questions kept in memory
+    QUESTION_CACHE_SIZE = 4096
+    
+    # Fields every question must provide, in the order they are reported when missing
+    REQUIRED_FIELDS = ('question_text', 'answer_a', 'answer_b', 'answer_c', 'answer_d', 'correct_answer')
+    REQUIRED_FIELD_SET = frozenset(REQUIRED_FIELDS)
+    
+    VALID_ANSWERS = frozenset('ABCD')
+    
+    STUDENT_LIST_QUERY = "SELECT DISTINCT student_id FROM scores ORDER BY student_id"
+    
+    # Falls back to a generated title for deleted worksheets; rows are unpacked
+    # by position, so keep the column order in step with get_student_answered_questions
+    STUDENT_ANSWERED_QUERY = """
+    SELECT s.question_id, s.worksheet_id,
+           COALESCE(w.title, 'Worksheet #' || s.worksheet_id) AS title
+    FROM scores s 
+    LEFT JOIN worksheets w ON s.worksheet_id = w.worksheet_id
+    WHERE s.student_id = ? 
+    GROUP BY s.question_id
+    """
+    
     def __init__(self, question_repository: QuestionRepository):
         """
         Initialize the QuestionManager.
@@ -28,6 +55,15 @@ class QuestionManager:
         """
         self.logger = get_logger(__name__)
         self.question_repository = question_repository
+        # Used directly for the student queries; repositories without one skip them
+        self._db_manager = getattr(question_repository, 'db_manager', None)
+        
+        # Cache-aside stores for reads, dropped as soon as the repository
+        # reports a write (see QuestionRepository.data_version)
+        self._list_cache: OrderedDict = OrderedDict()
+        self._question_cache: OrderedDict = OrderedDict()
+        self._count_cache: Optional[int] = None
+        self._cache_version = question_repository.data_version
     
     def create_question(self, question_data: Dict[str, Any]) -> Optional[int]:
         """
@@ -46,30 +82,63 @@ class QuestionManager:
             # Validate required fields
             self._validate_question_data(question_data)
             
-            # Create Question instance
-            question = Question.from_dict(question_data)
-            
-            # Set created and updated timestamps
-            question.created_at = datetime.now()
-            question.updated_at = datetime.now()
-            
-            # Add to repository
-            question_id = self.question_repository.add_question(question)
+            # Add to repository; the database sets the created and updated timestamps
+            question_id = self.question_repository.add_question_dict(question_data)
             
             if question_id:
-                self.logger.info(f"Created question with ID: {question_id}")
+                self.logger.info("Created question with ID: %s", question_id)
                 return question_id
             else:
                 self.logger.error("Failed to create question")
                 return None
                 
         except ValueError as ve:
-            self.logger.error(f"Validation error creating question: {str(ve)}")
+            self.logger.error("Validation error creating question: %s", ve)
             raise
         except Exception as e:
-            self.logger.error(f"Error creating question: {str(e)}")
+            self.logger.error("Error creating question: %s", e)
             return None
     
+    def create_questions(self, items: List[Dict[str, Any]]) -> List[int]:
+        """
+        Create several questions in a single transaction.
+        
+        All items are validated before anything is written, so either every
+        question is created or none is.
+        
+        Args:
+            items: List of dictionaries containing question data
+        
+        Returns:
+            The IDs of the created questions in input order, or an empty list
+            if an error occurred
+        
+        Raises:
+            ValueError: If any of the question data is invalid
+        """
+        try:
+            for index, question_data in enumerate(items):
+                try:
+                    self._validate_question_data(question_data)
+                except ValueError as ve:
+                    raise ValueError(f"Question {index + 1}: {str(ve)}") from ve
+            
+            question_ids = self.question_repository.add_question_dicts(items)
+            
+            if question_ids:
+                self.logger.info("Created %d questions", len(question_ids))
+            elif items:
+                self.logger.error("Failed to create questions")
+            
+            return question_ids
+            
+        except ValueError as ve:
+            self.logger.error("Validation error creating questions: %s", ve)
+            raise
+        except Exception as e:
+            self.logger.error("Error creating questions: %s", e)
+            return []
+    
     def update_question(self, question_id: int, question_data: Dict[str, Any]) -> bool:
         """
         Update an existing question.
@@ -87,8 +156,7 @@ class QuestionManager:
         """
         try:
             # Check if question exists
-            existing_question = self.question_repository.get_question(question_id)
-            if not existing_question:
+            if not self.get_question(question_id):
                 error_msg = f"Question with ID {question_id} does not exist"
                 self.logger.error(error_msg)
                 raise KeyError(error_msg)
@@ -100,30 +168,25 @@ class QuestionManager:
             updated_question = Question.from_dict(question_data)
             updated_question.question_id = question_id
             
-            # Keep original creation timestamp
-            updated_question.created_at = existing_question.created_at
-            
-            # Update timestamp
-            updated_question.updated_at = datetime.now()
-            
-            # Update in repository
-            success = self.question_repository.update_question(updated_question)
+            # Update in repository, which stamps updated_at in SQL and keeps the
+            # original creation timestamp
+            updated = self.question_repository.update_question(updated_question)
             
-            if success:
-                self.logger.info(f"Updated question with ID: {question_id}")
+            if updated:
+                self.logger.info("Updated question with ID: %s", question_id)
                 return True
             else:
-                self.logger.error(f"Failed to update question with ID: {question_id}")
+                self.logger.error("Failed to update question with ID: %s", question_id)
                 return False
                 
         except ValueError as ve:
-            self.logger.error(f"Validation error updating question: {str(ve)}")
+            self.logger.error("Validation error updating question: %s", ve)
             raise
         except KeyError as ke:
-            self.logger.error(f"Question not found: {str(ke)}")
+            self.logger.error("Question not found: %s", ke)
             raise
         except Exception as e:
-            self.logger.error(f"Error updating question: {str(e)}")
+            self.logger.error("Error updating question: %s", e)
             return False
     
     def delete_question(self, question_id: int) -> bool:
@@ -141,27 +204,26 @@ class QuestionManager:
         """
         try:
             # Check if question exists
-            existing_question = self.question_repository.get_question(question_id)
-            if not existing_question:
+            if not self.get_question(question_id):
                 error_msg = f"Question with ID {question_id} does not exist"
                 self.logger.error(error_msg)
                 raise KeyError(error_msg)
             
             # Delete from repository
-            success = self.question_repository.delete_question(question_id)
+            deleted = self.question_repository.delete_question(question_id)
             
-            if success:
-                self.logger.info(f"Deleted question with ID: {question_id}")
+            if deleted:
+                self.logger.info("Deleted question with ID: %s", question_id)
                 return True
             else:
-                self.logger.error(f"Failed to delete question with ID: {question_id}")
+                self.logger.error("Failed to delete question with ID: %s", question_id)
                 return False
                 
         except KeyError as ke:
-            self.logger.error(f"Question not found: {str(ke)}")
+            self.logger.error("Question not found: %s", ke)
             raise
         except Exception as e:
-            self.logger.error(f"Error deleting question: {str(e)}")
+            self.logger.error("Error deleting question: %s", e)
             return False
     
     def get_question(self, question_id: int) -> Optional[Question]:
@@ -175,9 +237,24 @@ class QuestionManager:
             The Question, or None if not found
         """
         try:
-            return self.question_repository.get_question(question_id)
+            self._check_cache_version()
+            
+            question = self._question_cache.get(question_id)
+            if question is not None:
+                self._question_cache.move_to_end(question_id)
+                return self._copy_question(question)
+            
+            question = self.question_repository.get_question(question_id)
+            if question is None:
+                return None
+            
+            self._question_cache[question_id] = question
+            if len(self._question_cache) > self.QUESTION_CACHE_SIZE:
+                self._question_cache.popitem(last=False)
+            
+            return self._copy_question(question)
         except Exception as e:
-            self.logger.error(f"Error getting question: {str(e)}")
+            self.logger.error("Error getting question: %s", e)
             return None
     
     def get_all_questions(self, limit=None, offset=None) -> List[Question]:
@@ -191,7 +268,10 @@ class QuestionManager:
         Returns:
             A list of Questions, potentially limited by pagination parameters
         """
-        return self.question_repository.get_all_questions(limit=limit, offset=offset)
+        return self._get_cached_list(
+            ('all', limit, offset),
+            functools.partial(self.question_repository.get_all_questions, limit=limit, offset=offset)
+        )
     
     def filter_questions(self, filters: Dict[str, Any], limit=None, offset=None) -> List[Question]:
         """
@@ -209,7 +289,92 @@ class QuestionManager:
         Returns:
             A list of Questions matching the criteria
         """
-        return self.question_repository.filter_questions(filters, limit=limit, offset=offset)
+        # Without any active criteria this is the same query as listing everything
+        if not filters or not any(filters.values()):
+            return self.get_all_questions(limit=limit, offset=offset)
+        
+        loader = functools.partial(self.question_repository.filter_questions, filters, limit=limit, offset=offset)
+        
+        try:
+            key = ('filter', self._filters_key(filters), limit, offset)
+            hash(key)
+        except TypeError:
+            # Filter values that cannot be hashed are simply not cached
+            return loader()
+        
+        return self._get_cached_list(key, loader)
+    
+    def _get_cached_list(self, key: Tuple, loader: Callable[[], List[Question]]) -> List[Question]:
+        """
+        Return a list read from the cache, loading and storing it on a miss.
+        
+        Args:
+            key: Hashable key identifying the query
+            loader: Function that runs the query against the repository
+        
+        Returns:
+            A new list of copies of the cached Question objects
+        """
+        self._check_cache_version()
+        
+        questions = self._list_cache.get(key)
+        if questions is not None:
+            self._list_cache.move_to_end(key)
+            return [self._copy_question(question) for question in questions]
+        
+        questions = loader()
+        
+        # Empty results are not cached: the repository also returns [] on errors
+        if questions:
+            self._list_cache[key] = questions
+            if len(self._list_cache) > self.LIST_CACHE_SIZE:
+                self._list_cache.popitem(last=False)
+        
+        return [self._copy_question(question) for question in questions]
+    
+    def _check_cache_version(self) -> None:
+        """
+        Clear the read caches if the repository has been written to since they were filled.
+        
+        Cached results therefore never outlive a create, update, delete or import.
+        """
+        version = self.question_repository.data_version
+        if version != self._cache_version:
+            self._list_cache.clear()
+            self._question_cache.clear()
+            self._count_cache = None
+            self._cache_version = version
+    
+    @staticmethod
+    def _copy_question(question: Question) -> Question:
+        """
+        Copy a cached question so callers can modify it without changing the cache.
+        
+        Args:
+            question: Cached Question
+        
+        Returns:
+            A shallow copy with its own subject_tags list
+        """
+        question_copy = copy.copy(question)
+        question_copy.subject_tags = list(question.subject_tags)
+        return question_copy
+    
+    @staticmethod
+    def _filters_key(filters: Dict[str, Any]) -> Tuple:
+        """
+        Build a cache key from filter criteria.
+        
+        Args:
+            filters: Dictionary of filter criteria
+        
+        Returns:
+            A tuple of (name, value) pairs sorted by name, with list values as tuples
+        """
+        return tuple(sorted(
+            (name, tuple(value) if isinstance(value, list) else value)
+            for name, value in filters.items()
+        ))
     
     def count_all_questions(self) -> int:
         """
@@ -219,9 +384,18 @@ class QuestionManager:
             The total number of questions in the database
         """
         try:
-            return self.question_repository.count_all_questions()
+            self._check_cache_version()
+            
+            if self._count_cache is None:
+                count = self.question_repository.count_all_questions(approximate=True)
+                # The repository also returns 0 on errors, so only non-zero counts are kept
+                if not count:
+                    return count
+                self._count_cache = count
+            
+            return self._count_cache
         except Exception as e:
-            self.logger.error(f"Error counting questions: {str(e)}")
+            self.logger.error("Error counting questions: %s", e)
             return 0
     
     def count_filtered_questions(self, filters: Dict[str, Any]) -> int:
@@ -235,36 +409,56 @@ class QuestionManager:
             The number of questions matching the filter criteria
         """
         try:
+            # Without any active criteria every question matches
+            if not filters or not any(filters.values()):
+                return self.count_all_questions()
+            
             return self.question_repository.count_filtered_questions(filters)
         except Exception as e:
-            self.logger.error(f"Error counting filtered questions: {str(e)}")
+            self.logger.error("Error counting filtered questions: %s", e)
             return 0
     
-    def get_questions_by_tag(self, tag: str) -> List[Question]:
+    def get_questions_by_tag(self, tag: str, limit=None, offset=None) -> List[Question]:
         """
-        Get questions by subject tag.
+        Get questions by subject tag with pagination support.
         
         Args:
             tag: The subject tag to filter by
+            limit: Maximum number of questions to return (None returns all)
+            offset: Number of questions to skip (for pagination)
         
         Returns:
             A list of Questions with the given tag
         """
-        filters = {'subject_tags': tag}
-        return self.filter_questions(filters)
+        # An empty tag filters nothing, as in filter_questions
+        if not tag:
+            return self.get_all_questions(limit=limit, offset=offset)
+        
+        return self._get_cached_list(
+            ('tag', tag, limit, offset),
+            functools.partial(self.question_repository.find_by_tag, tag, limit=limit, offset=offset)
+        )
     
-    def get_questions_by_difficulty(self, difficulty: str) -> List[Question]:
+    def get_questions_by_difficulty(self, difficulty: str, limit=None, offset=None) -> List[Question]:
         """
-        Get questions by difficulty level.
+        Get questions by difficulty level with pagination support.
         
         Args:
             difficulty: The difficulty level to filter by
+            limit: Maximum number of questions to return (None returns all)
+            offset: Number of questions to skip (for pagination)
         
         Returns:
             A list of Questions with the given difficulty
         """
-        filters = {'difficulty': difficulty}
-        return self.filter_questions(filters)
+        # An empty difficulty filters nothing, as in filter_questions
+        if not difficulty:
+            return self.get_all_questions(limit=limit, offset=offset)
+        
+        return self._get_cached_list(
+            ('difficulty', difficulty, limit, offset),
+            functools.partial(self.question_repository.find_by_difficulty, difficulty, limit=limit, offset=offset)
+        )
     
     def _validate_question_data(self, question_data: Dict[str, Any]) -> None:
         """
@@ -276,16 +470,15 @@ class QuestionManager:
         Raises:
             ValueError: If the question data is invalid
         """
-        # Check required fields
-        required_fields = ['question_text', 'answer_a', 'answer_b', 'answer_c', 'answer_d', 'correct_answer']
-        for field in required_fields:
-            if field not in question_data or not question_data[field]:
-                raise ValueError(f"Missing required field: {field}")
+        # Check required fields: absent keys with one set comparison, then empty values
+        if not (question_data.keys() >= self.REQUIRED_FIELD_SET
+                and all(question_data[field] for field in self.REQUIRED_FIELDS)):
+            field = next(field for field in self.REQUIRED_FIELDS if not question_data.get(field))
+            raise ValueError(f"Missing required field: {field}")
         
         # Validate correct answer
-        valid_answers = ['A', 'B', 'C', 'D']
-        if question_data['correct_answer'] not in valid_answers:
-            raise ValueError(f"Invalid correct_answer. Must be one of {valid_answers}")
+        if question_data['correct_answer'] not in self.VALID_ANSWERS:
+            raise ValueError(f"Invalid correct_answer. Must be one of {sorted(self.VALID_ANSWERS)}")
     
     def get_student_list(self) -> List[str]:
         """
@@ -295,21 +488,15 @@ class QuestionManager:
             A list of student IDs
         """
         try:
-            # Try to access the database manager directly
-            if hasattr(self.question_repository, 'db_manager'):
-                db_manager = self.question_repository.db_manager
-                query = "SELECT DISTINCT student_id FROM scores ORDER BY student_id"
-                result = db_manager.execute_query(query)
-                
-                if not result:
-                    return []
-                
-                return [row['student_id'] for row in result]
+            if self._db_manager is None:
+                return []
             
-            return []
+            result = self._db_manager.execute_query(self.STUDENT_LIST_QUERY)
+            
+            return [row['student_id'] for row in result or ()]
             
         except Exception as e:
-            self.logger.error(f"Error getting student list: {str(e)}")
+            self.logger.error("Error getting student list: %s", e)
             return []
     
     def get_student_answered_questions(self, student_id: str) -> Dict[int, Any]:
@@ -323,37 +510,15 @@ class QuestionManager:
             A dictionary mapping question IDs to [worksheet_id, worksheet_title] lists
         """
         try:
-            # Check if we can access the database manager
-            if not hasattr(self.question_repository, 'db_manager'):
+            if self._db_manager is None:
                 return {}
-                
-            db_manager = self.question_repository.db_manager
             
             # Query the database for all questions this student has answered
-            query = """
-            SELECT s.question_id, s.worksheet_id, w.title 
-            FROM scores s 
-            LEFT JOIN worksheets w ON s.worksheet_id = w.worksheet_id
-            WHERE s.student_id = ? 
-            GROUP BY s.question_id
-            """
-            
-            result = db_manager.execute_query(query, (student_id,))
-            
-            # Build the answered questions dictionary
-            student_answered_questions = {}
-            
-            if result:
-                for row in result:
-                    question_id = row['question_id']
-                    worksheet_id = row['worksheet_id']
-                    worksheet_title = row.get('title', f"Worksheet #{worksheet_id}")
-                    
-                    # Store the worksheet information with the question
-                    student_answered_questions[question_id] = [worksheet_id, worksheet_title]
+            result = self._db_manager.execute_query_tuples(self.STUDENT_ANSWERED_QUERY, (student_id,))
             
-            return student_answered_questions
+            # Map each question to the worksheet it was answered on
+            return {question_id: [worksheet_id, title] for question_id, worksheet_id, title in result or ()}
             
         except Exception as e:
-            self.logger.error(f"Error getting student answered questions: {str(e)}")
+            self.logger.error("Error getting student answered questions: %s", e)
             return {}
\ No newline at end of file
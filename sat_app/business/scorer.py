@@ -3,13 +3,14 @@ Scoring and analytics module for the SAT Question Bank application.
 Provides functionality for recording student responses and computing analytics.
 """
 import logging
-from typing import List, Dict, Any, Optional, Tuple
+from typing import Callable, List, Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta
-import statistics
-from collections import defaultdict, Counter
+from collections import OrderedDict, Counter
+
+import numpy as np
 
 from sat_app.dal.repositories import ScoreRepository, QuestionRepository, WorksheetRepository
-from sat_app.dal.models import Score, Question, Worksheet
+from sat_app.dal.models import Score, Worksheet
 
 
 class ScoringService:
@@ -20,6 +21,10 @@ class ScoringService:
     and generating analytics reports.
     """
     
+    # Maximum number of analytics results kept in memory
+    ANALYTICS_CACHE_SIZE = 256
+    WORKSHEET_CACHE_SIZE = 128
+    
     def __init__(self, score_repository: ScoreRepository, question_repository: QuestionRepository,
                  worksheet_repository: Optional[WorksheetRepository] = None):
         """
@@ -34,6 +39,13 @@ class ScoringService:
         self.score_repository = score_repository
         self.question_repository = question_repository
         self.worksheet_repository = worksheet_repository
+        
+        # Analytics results keyed by the score and question data versions they were
+        # computed from, so a write makes them unreachable instead of stale
+        self._analytics_cache: OrderedDict = OrderedDict()
+        
+        # Worksheet listings, keyed the same way by the worksheet and question data versions
+        self._worksheet_cache: OrderedDict = OrderedDict()
     
     def record_answer(self, student_id: str, worksheet_id: int, question_id: int, correct: bool) -> bool:
         """
@@ -79,16 +91,45 @@ class ScoringService:
         """
         Calculate performance metrics for a student.
         
+        Results are cached until scores or questions change.
+        
+        Args:
+            student_id: ID of the student
+        
+        Returns:
+            Dictionary of performance metrics (shared; do not modify)
+        """
+        return self._get_cached_analytics(
+            ('student_performance', student_id),
+            lambda: self._calculate_student_performance(student_id)
+        )
+    
+    def _calculate_student_performance(self, student_id: str) -> Dict[str, Any]:
+        """
+        Calculate performance metrics for a student without the cache.
+        
         Args:
             student_id: ID of the student
         
         Returns:
             Dictionary of performance metrics
         """
-        scores = self.score_repository.get_scores_by_student(student_id)
+        # Collect everything the metrics need in a single pass over the scores and
+        # the question fields they are analysed by, streamed from one query
+        question_ids = []
+        correct_flags = []
+        worksheet_ids = set()
+        question_map = {}
+        for row in self.score_repository.iter_student_scores_with_questions(student_id):
+            question_id = row['question_id']
+            question_ids.append(question_id)
+            correct_flags.append(bool(row['correct']))
+            worksheet_ids.add(row['worksheet_id'])
+            if row['has_question']:
+                question_map[question_id] = row
         
         # If no scores, return empty metrics
-        if not scores:
+        if not question_ids:
             return {
                 "student_id": student_id,
                 "total_questions": 0,
@@ -100,32 +141,25 @@ class ScoringService:
                 "recent_performance": []
             }
         
-        # Get all question IDs from scores
-        question_ids = [score.question_id for score in scores]
-        
-        # Get question details for analysis
-        questions = []
-        for question_id in question_ids:
-            question = self.question_repository.get_question(question_id)
-            if question:
-                questions.append(question)
-        
         # Calculate basic metrics
-        total_questions = len(scores)
-        total_correct = sum(1 for score in scores if score.correct)
-        percentage_correct = (total_correct / total_questions) * 100 if total_questions > 0 else 0
+        total_questions = len(question_ids)
+        total_correct = sum(correct_flags)
+        percentage_correct = (total_correct / total_questions) * 100
         
         # Calculate unique worksheets completed
-        worksheets_completed = len(set(score.worksheet_id for score in scores))
+        worksheets_completed = len(worksheet_ids)
+        
+        # Count per question, then group by the fields of questions that still exist
+        question_counts = self._count_by_question(question_ids, correct_flags)
         
         # Calculate performance by subject
-        subject_performance = self._calculate_subject_performance(scores, questions)
+        subject_performance = self._calculate_subject_performance(question_counts, question_map)
         
         # Calculate performance by difficulty
-        difficulty_performance = self._calculate_difficulty_performance(scores, questions)
+        difficulty_performance = self._calculate_difficulty_performance(question_counts, question_map)
         
         # Calculate recent performance trend
-        recent_performance = self._calculate_recent_performance(scores)
+        recent_performance = self._calculate_recent_performance(student_id)
         
         return {
             "student_id": student_id,
@@ -148,11 +182,11 @@ class ScoringService:
         Returns:
             Dictionary of performance metrics for the question
         """
-        # Get all scores for this question
-        scores = self._get_all_scores_for_question(question_id)
+        # Count the scores for this question in SQL
+        summary = self.score_repository.get_score_summary(question_id)
         
         # If no scores, return empty metrics
-        if not scores:
+        if not summary['total']:
             return {
                 "question_id": question_id,
                 "total_attempts": 0,
@@ -162,10 +196,10 @@ class ScoringService:
             }
         
         # Calculate metrics
-        total_attempts = len(scores)
-        correct_attempts = sum(1 for score in scores if score.correct)
-        success_rate = (correct_attempts / total_attempts) * 100 if total_attempts > 0 else 0
-        student_count = len(set(score.student_id for score in scores))
+        total_attempts = summary['total']
+        correct_attempts = summary['correct']
+        success_rate = (correct_attempts / total_attempts) * 100
+        student_count = summary['students']
         
         return {
             "question_id": question_id,
@@ -185,11 +219,11 @@ class ScoringService:
         Returns:
             Dictionary of performance metrics for the worksheet
         """
-        # Get all scores for this worksheet
-        scores = self.score_repository.get_scores_by_worksheet(worksheet_id)
+        # Count each student's scores on this worksheet in SQL
+        summaries = self.score_repository.get_worksheet_student_summaries(worksheet_id)
         
         # If no scores, return empty metrics
-        if not scores:
+        if not summaries:
             return {
                 "worksheet_id": worksheet_id,
                 "total_attempts": 0,
@@ -198,27 +232,27 @@ class ScoringService:
                 "student_performances": []
             }
         
-        # Get unique students who attempted this worksheet
-        student_ids = set(score.student_id for score in scores)
-        student_count = len(student_ids)
+        # Each summary row is one student who attempted this worksheet
+        student_count = len(summaries)
         
-        # Calculate performance for each student
+        # Calculate performance for each student, summing percentages as we go
         student_performances = []
-        for student_id in student_ids:
-            student_scores = [score for score in scores if score.student_id == student_id]
-            total_questions = len(student_scores)
-            correct_answers = sum(1 for score in student_scores if score.correct)
-            percentage = (correct_answers / total_questions) * 100 if total_questions > 0 else 0
+        percentage_sum = 0.0
+        for summary in summaries:
+            total_questions = summary['total']
+            correct_answers = summary['correct']
+            percentage = (correct_answers / total_questions) * 100
+            percentage_sum += percentage
             
             student_performances.append({
-                "student_id": student_id,
+                "student_id": summary['student_id'],
                 "total_questions": total_questions,
                 "correct_answers": correct_answers,
                 "percentage": percentage
             })
         
         # Calculate average score across all students
-        average_score = statistics.mean([perf["percentage"] for perf in student_performances]) if student_performances else 0
+        average_score = percentage_sum / student_count
         
         return {
             "worksheet_id": worksheet_id,
@@ -232,14 +266,25 @@ class ScoringService:
         """
         Get comparative analytics across all students.
         
+        Results are cached until scores change.
+        
+        Returns:
+            Dictionary of comparative analytics (shared; do not modify)
+        """
+        return self._get_cached_analytics(('comparative',), self._calculate_comparative_analytics)
+    
+    def _calculate_comparative_analytics(self) -> Dict[str, Any]:
+        """
+        Calculate comparative analytics across all students without the cache.
+        
         Returns:
             Dictionary of comparative analytics
         """
-        # Get all scores
-        all_scores = self._get_all_scores()
+        # Count all scores in SQL
+        summary = self.score_repository.get_score_summary()
         
         # If no scores, return empty metrics
-        if not all_scores:
+        if not summary['total']:
             return {
                 "total_students": 0,
                 "total_questions_answered": 0,
@@ -248,28 +293,23 @@ class ScoringService:
                 "easy_questions": []
             }
         
-        # Get unique students
-        student_ids = set(score.student_id for score in all_scores)
-        total_students = len(student_ids)
-        
-        # Calculate total questions answered
-        total_questions_answered = len(all_scores)
+        total_students = summary['students']
+        total_questions_answered = summary['total']
         
         # Calculate average score across all students
-        correct_answers = sum(1 for score in all_scores if score.correct)
-        average_score = (correct_answers / total_questions_answered) * 100 if total_questions_answered > 0 else 0
-        
-        # Identify difficult and easy questions
-        question_performance = self._calculate_question_success_rates(all_scores)
-        
-        # Sort by success rate
-        sorted_questions = sorted(question_performance.items(), key=lambda x: x[1])
+        average_score = (summary['correct'] / total_questions_answered) * 100
         
         # Get 5 most difficult questions (lowest success rate)
-        difficult_questions = [{"question_id": q_id, "success_rate": rate} for q_id, rate in sorted_questions[:5]]
+        difficult_questions = [
+            {"question_id": row['question_id'], "success_rate": (row['correct'] / row['total']) * 100}
+            for row in self.score_repository.get_question_success_extremes(5, hardest=True)
+        ]
         
-        # Get 5 easiest questions (highest success rate)
-        easy_questions = [{"question_id": q_id, "success_rate": rate} for q_id, rate in sorted_questions[-5:]]
+        # Get 5 easiest questions (highest success rate), in ascending order of rate
+        easy_questions = [
+            {"question_id": row['question_id'], "success_rate": (row['correct'] / row['total']) * 100}
+            for row in self.score_repository.get_question_success_extremes(5, hardest=False)
+        ]
         
         return {
             "total_students": total_students,
@@ -283,56 +323,57 @@ class ScoringService:
         """
         Calculate mastery levels for a student by subject.
         
+        Results are cached until scores or questions change.
+        
+        Args:
+            student_id: ID of the student
+        
+        Returns:
+            Dictionary of mastery levels by subject (shared; do not modify)
+        """
+        return self._get_cached_analytics(
+            ('mastery_levels', student_id),
+            lambda: self._calculate_mastery_levels(student_id)
+        )
+    
+    def _calculate_mastery_levels(self, student_id: str) -> Dict[str, Any]:
+        """
+        Calculate mastery levels for a student by subject without the cache.
+        
         Args:
             student_id: ID of the student
         
         Returns:
             Dictionary of mastery levels by subject
         """
-        scores = self.score_repository.get_scores_by_student(student_id)
+        # Stream the scores and the question fields they are analysed by
+        question_ids = []
+        correct_flags = []
+        question_map = {}
+        for row in self.score_repository.iter_student_scores_with_questions(student_id):
+            question_id = row['question_id']
+            question_ids.append(question_id)
+            correct_flags.append(bool(row['correct']))
+            if row['has_question']:
+                question_map[question_id] = row
         
         # If no scores, return empty result
-        if not scores:
+        if not question_ids:
             return {
                 "student_id": student_id,
                 "mastery_levels": {}
             }
         
-        # Get all question IDs from scores
-        question_ids = [score.question_id for score in scores]
-        
-        # Get question details for analysis
-        questions = []
-        for question_id in question_ids:
-            question = self.question_repository.get_question(question_id)
-            if question:
-                questions.append(question)
-        
-        # Map each score to its question
-        # Use a list of tuples instead of a dict with Score objects as keys
-        score_question_pairs = []
-        for score in scores:
-            for question in questions:
-                if score.question_id == question.question_id:
-                    score_question_pairs.append((score, question))
-                    break
-        
-        # Group by subject
-        subject_scores = defaultdict(list)
-        for score, question in score_question_pairs:
-            for tag in question.subject_tags:
-                subject_scores[tag].append(score.correct)
+        # Group the per-question counts by subject
+        question_counts = self._count_by_question(question_ids, correct_flags)
+        subject_counts = self._group_question_counts(
+            question_counts, question_map, lambda question: question['subject_tags'] or ()
+        )
         
         # Calculate mastery level for each subject
         mastery_levels = {}
-        for subject, results in subject_scores.items():
-            if not results:
-                continue
-            
-            correct_count = sum(1 for result in results if result)
-            total_count = len(results)
-            
-            percentage = (correct_count / total_count) * 100 if total_count > 0 else 0
+        for subject, (correct_count, total_count) in subject_counts.items():
+            percentage = (correct_count / total_count) * 100
             
             # Define mastery levels
             if percentage >= 90:
@@ -358,186 +399,162 @@ class ScoringService:
             "mastery_levels": mastery_levels
         }
     
-    def _calculate_subject_performance(self, scores: List[Score], questions: List[Question]) -> Dict[str, Dict[str, Any]]:
+    def _get_cached_analytics(self, key: Tuple, compute: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Return an analytics result from the cache, computing and storing it on a miss.
+        
+        Args:
+            key: Hashable key identifying the calculation
+            compute: Function that performs the calculation
+        
+        Returns:
+            The analytics result
+        """
+        key += (self.score_repository.data_version, self.question_repository.data_version)
+        
+        result = self._analytics_cache.get(key)
+        if result is not None:
+            self._analytics_cache.move_to_end(key)
+            return result
+        
+        result = compute()
+        self._analytics_cache[key] = result
+        if len(self._analytics_cache) > self.ANALYTICS_CACHE_SIZE:
+            self._analytics_cache.popitem(last=False)
+        
+        return result
+    
+    def _calculate_subject_performance(self, question_counts: List[Tuple[int, int, int]],
+                                       question_map: Dict[int, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
         """
         Calculate performance by subject.
         
         Args:
-            scores: List of Score objects
-            questions: List of Question objects
+            question_counts: List of (question_id, correct, total) tuples
+            question_map: Question fields by ID, as returned by get_student_scores_with_questions
         
         Returns:
             Dictionary of performance metrics by subject
         """
-        # Map question ID to question
-        question_map = {q.question_id: q for q in questions}
-        
-        # Group scores by subject
-        subject_scores = defaultdict(list)
-        for score in scores:
-            if score.question_id in question_map:
-                question = question_map[score.question_id]
-                for tag in question.subject_tags:
-                    subject_scores[tag].append(score.correct)
+        # Group the per-question counts by subject
+        subject_counts = self._group_question_counts(
+            question_counts, question_map, lambda question: question['subject_tags'] or ()
+        )
         
         # Calculate performance for each subject
-        subject_performance = {}
-        for subject, results in subject_scores.items():
-            correct = sum(1 for result in results if result)
-            total = len(results)
-            percentage = (correct / total) * 100 if total > 0 else 0
-            
-            subject_performance[subject] = {
+        return {
+            subject: {
                 "correct": correct,
                 "total": total,
-                "percentage": percentage
+                "percentage": (correct / total) * 100
             }
-        
-        return subject_performance
+            for subject, (correct, total) in subject_counts.items()
+        }
     
-    def _calculate_difficulty_performance(self, scores: List[Score], questions: List[Question]) -> Dict[str, Dict[str, Any]]:
+    def _calculate_difficulty_performance(self, question_counts: List[Tuple[int, int, int]],
+                                          question_map: Dict[int, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
         """
         Calculate performance by difficulty level.
         
         Args:
-            scores: List of Score objects
-            questions: List of Question objects
+            question_counts: List of (question_id, correct, total) tuples
+            question_map: Question fields by ID, as returned by get_student_scores_with_questions
         
         Returns:
             Dictionary of performance metrics by difficulty level
         """
-        # Map question ID to question
-        question_map = {q.question_id: q for q in questions}
-        
-        # Group scores by difficulty
-        difficulty_scores = defaultdict(list)
-        for score in scores:
-            if score.question_id in question_map:
-                question = question_map[score.question_id]
-                difficulty = question.difficulty_label or "Unspecified"
-                difficulty_scores[difficulty].append(score.correct)
+        # Group the per-question counts by difficulty
+        difficulty_counts = self._group_question_counts(
+            question_counts, question_map,
+            lambda question: (question['difficulty_label'] or "Unspecified",)
+        )
         
         # Calculate performance for each difficulty level
-        difficulty_performance = {}
-        for difficulty, results in difficulty_scores.items():
-            correct = sum(1 for result in results if result)
-            total = len(results)
-            percentage = (correct / total) * 100 if total > 0 else 0
-            
-            difficulty_performance[difficulty] = {
+        return {
+            difficulty: {
                 "correct": correct,
                 "total": total,
-                "percentage": percentage
+                "percentage": (correct / total) * 100
             }
-        
-        return difficulty_performance
+            for difficulty, (correct, total) in difficulty_counts.items()
+        }
     
-    def _calculate_recent_performance(self, scores: List[Score]) -> List[Dict[str, Any]]:
+    def _count_by_question(self, question_ids: List[int], correct_flags: List[bool]) -> List[Tuple[int, int, int]]:
         """
-        Calculate recent performance trend.
+        Count correct answers and attempts per question with NumPy.
         
         Args:
-            scores: List of Score objects
+            question_ids: Question ID of each score
+            correct_flags: Whether each score was correct
         
         Returns:
-            List of performance metrics over time
+            List of (question_id, correct, total) tuples, in the order each
+            question first appears in question_ids
         """
-        # Sort scores by timestamp in ascending order
-        sorted_scores = sorted(scores, key=lambda s: s.timestamp)
-        
-        # Group scores by day
-        daily_scores = defaultdict(list)
-        for score in sorted_scores:
-            day = score.timestamp.date()
-            daily_scores[day].append(score.correct)
-        
-        # Calculate daily performance
-        daily_performance = []
-        for day, results in sorted(daily_scores.items()):
-            correct = sum(1 for result in results if result)
-            total = len(results)
-            percentage = (correct / total) * 100 if total > 0 else 0
-            
-            daily_performance.append({
-                "date": day.isoformat(),
-                "correct": correct,
-                "total": total,
-                "percentage": percentage
-            })
+        if not question_ids:
+            return []
         
-        # Return the last 30 days of data (or less if not available)
-        return daily_performance[-30:]
-    
-    def _get_all_scores(self) -> List[Score]:
-        """
-        Get all scores from the database.
+        question_ids = np.array(question_ids, dtype=np.int64)
+        correct = np.array(correct_flags, dtype=np.int64)
         
-        Returns:
-            List of all Score objects
-        """
-        try:
-            # This is a custom query that needs to be implemented in the repository
-            # For now, we'll use a workaround to get all scores
-            query = "SELECT * FROM scores"
-            result = self.score_repository.db_manager.execute_query(query)
-            
-            if not result:
-                return []
-            
-            return [Score.from_dict(row) for row in result]
-            
-        except Exception as e:
-            self.logger.error(f"Error getting all scores: {str(e)}")
-            return []
+        # Factorize the IDs, then count per question in C
+        unique_ids, first_index, inverse = np.unique(question_ids, return_index=True, return_inverse=True)
+        totals = np.bincount(inverse)
+        correct_counts = np.bincount(inverse, weights=correct).astype(np.int64)
+        
+        order = np.argsort(first_index, kind='stable')
+        return list(zip(unique_ids[order].tolist(), correct_counts[order].tolist(), totals[order].tolist()))
     
-    def _get_all_scores_for_question(self, question_id: int) -> List[Score]:
+    def _group_question_counts(self, question_counts: List[Tuple[int, int, int]],
+                               question_map: Dict[int, Dict[str, Any]],
+                               get_groups: Callable[[Dict[str, Any]], List[str]]) -> Dict[str, List[int]]:
         """
-        Get all scores for a specific question.
+        Add up per-question counts into groups such as subjects or difficulty levels.
         
         Args:
-            question_id: ID of the question
+            question_counts: List of (question_id, correct, total) tuples
+            question_map: Question fields by ID; questions not in it are skipped
+            get_groups: Function returning the groups a question counts towards
         
         Returns:
-            List of Score objects for the question
+            Dictionary mapping each group to [correct, total], in order of first appearance
         """
-        try:
-            query = "SELECT * FROM scores WHERE question_id = ?"
-            result = self.score_repository.db_manager.execute_query(query, (question_id,))
-            
-            if not result:
-                return []
-            
-            return [Score.from_dict(row) for row in result]
+        group_counts = {}
+        for question_id, correct, total in question_counts:
+            question = question_map.get(question_id)
+            if not question:
+                continue
             
-        except Exception as e:
-            self.logger.error(f"Error getting scores for question: {str(e)}")
-            return []
+            for group in get_groups(question):
+                counts = group_counts.setdefault(group, [0, 0])
+                counts[0] += correct
+                counts[1] += total
+        
+        return group_counts
     
-    def _calculate_question_success_rates(self, scores: List[Score]) -> Dict[int, float]:
+    def _calculate_recent_performance(self, student_id: str) -> List[Dict[str, Any]]:
         """
-        Calculate success rates for each question.
+        Calculate recent performance trend.
         
         Args:
-            scores: List of Score objects
+            student_id: ID of the student
         
         Returns:
-            Dictionary of question IDs mapped to success rates
+            List of performance metrics over time
         """
-        # Group scores by question ID
-        question_scores = defaultdict(list)
-        for score in scores:
-            question_scores[score.question_id].append(score.correct)
-        
-        # Calculate success rate for each question
-        question_success_rates = {}
-        for question_id, results in question_scores.items():
-            correct = sum(1 for result in results if result)
-            total = len(results)
-            success_rate = (correct / total) * 100 if total > 0 else 0
-            question_success_rates[question_id] = success_rate
-        
-        return question_success_rates
+        # The last 30 days with scores (or less if not available), grouped in SQL
+        daily_counts = self.score_repository.get_daily_performance(student_id, days=30)
         
+        return [
+            {
+                "date": row['day'],
+                "correct": row['correct'],
+                "total": row['total'],
+                "percentage": (row['correct'] / row['total']) * 100
+            }
+            for row in daily_counts
+        ]
+    
     def record_bulk_answers(self, student_id: str, worksheet_id: int, 
                            responses: Dict[int, bool]) -> Dict[str, Any]:
         """
@@ -552,19 +569,29 @@ class ScoringService:
             Dictionary with results of the operation
         """
         try:
-            success_count = 0
-            error_count = 0
+            scores = [
+                Score(student_id=student_id, worksheet_id=worksheet_id, question_id=question_id, correct=correct)
+                for question_id, correct in responses.items()
+            ]
+            
+            # Record every response in one transaction
+            if self.score_repository.add_scores(scores):
+                return {
+                    "success": True,
+                    "success_count": len(scores),
+                    "error_count": 0,
+                    "total_responses": len(responses)
+                }
             
+            # The batch was rolled back; record responses one at a time so a single
+            # bad row does not lose the rest. record_answer handles its own errors.
+            success_count = 0
             for question_id, correct in responses.items():
-                try:
-                    result = self.record_answer(student_id, worksheet_id, question_id, correct)
-                    if result:
-                        success_count += 1
-                    else:
-                        error_count += 1
-                except Exception as e:
-                    self.logger.error(f"Error recording response for question {question_id}: {str(e)}")
-                    error_count += 1
+                if self.record_answer(student_id, worksheet_id, question_id, correct):
+                    success_count += 1
+                else:
+                    self.logger.error(f"Error recording response for question {question_id}")
+            error_count = len(responses) - success_count
             
             return {
                 "success": True,
@@ -611,9 +638,12 @@ class ScoringService:
             # Determine which questions have been answered and which are still pending
             answered_questions = []
             unanswered_questions = []
+            correct_count = 0
+            
+            questions_by_id = self.question_repository.get_questions_by_ids(worksheet.question_ids)
             
             for q_id in worksheet.question_ids:
-                question = self.question_repository.get_question(q_id)
+                question = questions_by_id.get(q_id)
                 if not question:
                     continue
                 
@@ -623,9 +653,11 @@ class ScoringService:
                 }
                 
                 if q_id in scored_questions:
+                    correct = scored_questions[q_id]
                     question_data["answered"] = True
-                    question_data["correct"] = scored_questions[q_id]
+                    question_data["correct"] = correct
                     answered_questions.append(question_data)
+                    correct_count += correct
                 else:
                     question_data["answered"] = False
                     unanswered_questions.append(question_data)
@@ -633,7 +665,6 @@ class ScoringService:
             # Calculate statistics
             total_questions = len(worksheet.question_ids)
             answered_count = len(answered_questions)
-            correct_count = sum(1 for q in answered_questions if q.get("correct", False))
             
             return {
                 "success": True,
@@ -661,6 +692,17 @@ class ScoringService:
         """
         Get a list of available worksheets for student responses.
         
+        Results are cached until worksheets change.
+        
+        Returns:
+            List of worksheets with basic information (shared; do not modify)
+        """
+        return self._get_cached_worksheet_data(('available_worksheets',), self._load_available_worksheets)
+    
+    def _load_available_worksheets(self) -> List[Dict[str, Any]]:
+        """
+        Get a list of available worksheets without the cache.
+        
         Returns:
             List of worksheets with basic information
         """
@@ -689,6 +731,23 @@ class ScoringService:
         """
         Get all questions for a worksheet with answer choices.
         
+        Results are cached until the worksheets or questions change.
+        
+        Args:
+            worksheet_id: ID of the worksheet
+        
+        Returns:
+            List of questions with their answer choices (shared; do not modify)
+        """
+        return self._get_cached_worksheet_data(
+            ('worksheet_questions', worksheet_id),
+            lambda: self._load_questions_for_worksheet(worksheet_id)
+        )
+    
+    def _load_questions_for_worksheet(self, worksheet_id: int) -> List[Dict[str, Any]]:
+        """
+        Get all questions for a worksheet without the cache.
+        
         Args:
             worksheet_id: ID of the worksheet
         
@@ -707,10 +766,12 @@ class ScoringService:
                 self.logger.error(f"Worksheet {worksheet_id} not found")
                 return []
             
-            # Get all questions
+            # Get all questions with one query, keeping the worksheet order
+            questions_by_id = self.question_repository.get_questions_by_ids(worksheet.question_ids)
+            
             questions = []
             for q_id in worksheet.question_ids:
-                question = self.question_repository.get_question(q_id)
+                question = questions_by_id.get(q_id)
                 
                 if question:
                     questions.append({
@@ -738,6 +799,36 @@ class ScoringService:
             self.logger.error(f"Error getting questions for worksheet: {str(e)}")
             return []
     
+    def _get_cached_worksheet_data(self, key: Tuple,
+                                   load: Callable[[], List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        Return worksheet data from the cache, loading and storing it on a miss.
+        
+        Empty results are not cached, since they are also what a failed load returns.
+        
+        Args:
+            key: Hashable key identifying the data
+            load: Function that loads the data
+        
+        Returns:
+            The worksheet data
+        """
+        if self.worksheet_repository:
+            key += (self.worksheet_repository.data_version, self.question_repository.data_version)
+        
+        result = self._worksheet_cache.get(key)
+        if result is not None:
+            self._worksheet_cache.move_to_end(key)
+            return result
+        
+        result = load()
+        if result:
+            self._worksheet_cache[key] = result
+            if len(self._worksheet_cache) > self.WORKSHEET_CACHE_SIZE:
+                self._worksheet_cache.popitem(last=False)
+        
+        return result
+    
     def clear_student_worksheet_responses(self, student_id: str, worksheet_id: int) -> Dict[str, Any]:
         """
         Clear all responses for a student's worksheet.
@@ -750,11 +841,8 @@ class ScoringService:
             Dictionary with results of the operation
         """
         try:
-            # Execute a custom query to delete all scores for this student and worksheet
-            query = "DELETE FROM scores WHERE student_id = ? AND worksheet_id = ?"
-            result = self.score_repository.db_manager.execute_query(query, (student_id, worksheet_id))
-            
-            if result is not None:
+            # Delete all scores for this student and worksheet
+            if self.score_repository.delete_student_worksheet_scores(student_id, worksheet_id):
                 return {
                     "success": True,
                     "message": f"Cleared all responses for student {student_id} on worksheet {worksheet_id}"
@@ -3,6 +3,7 @@ Settings manager for the SAT Question Bank application.
 Handles application settings management, validation, and persistence.
 """
 import logging
+import os
 from typing import Dict, Any, Optional, List, Tuple
 
 from sat_app.config.config_manager import ConfigManager
@@ -16,6 +17,23 @@ class SettingsManager:
     with validation and persistence through the ConfigManager.
     """
     
+    # Currently supported themes
+    AVAILABLE_THEMES = ("light", "dark", "system")
+    
+    # Common font size options
+    AVAILABLE_FONT_SIZES = (8, 9, 10, 11, 12, 14, 16, 18, 20)
+    
+    # Set forms of the options above, for validation lookups
+    THEME_SET = frozenset(AVAILABLE_THEMES)
+    FONT_SIZE_SET = frozenset(AVAILABLE_FONT_SIZES)
+    
+    # Keys of the settings that hold file or directory paths, by section
+    PATH_SETTINGS = {
+        "database": frozenset({"path"}),
+        "images": frozenset({"question_images_dir", "answer_images_dir"}),
+        "output": frozenset({"worksheets_dir"})
+    }
+    
     def __init__(self, config_manager: ConfigManager):
         """
         Initialize the SettingsManager.
@@ -25,6 +43,9 @@ class SettingsManager:
         """
         self.logger = logging.getLogger(__name__)
         self.config_manager = config_manager
+        
+        # Directories already created or confirmed for path settings this session
+        self._ensured_dirs = set()
     
     def get_all_settings(self) -> Dict[str, Dict[str, Any]]:
         """
@@ -42,9 +63,7 @@ class SettingsManager:
         Returns:
             A dictionary containing UI settings
         """
-        if 'ui' in self.config_manager.config:
-            return self.config_manager.config['ui']
-        return {}
+        return self.config_manager.config.get('ui', {})
     
     def get_database_settings(self) -> Dict[str, Any]:
         """
@@ -53,9 +72,7 @@ class SettingsManager:
         Returns:
             A dictionary containing database settings
         """
-        if 'database' in self.config_manager.config:
-            return self.config_manager.config['database']
-        return {}
+        return self.config_manager.config.get('database', {})
     
     def get_image_settings(self) -> Dict[str, Any]:
         """
@@ -64,9 +81,7 @@ class SettingsManager:
         Returns:
             A dictionary containing image settings
         """
-        if 'images' in self.config_manager.config:
-            return self.config_manager.config['images']
-        return {}
+        return self.config_manager.config.get('images', {})
     
     def get_output_settings(self) -> Dict[str, Any]:
         """
@@ -75,9 +90,7 @@ class SettingsManager:
         Returns:
             A dictionary containing output settings
         """
-        if 'output' in self.config_manager.config:
-            return self.config_manager.config['output']
-        return {}
+        return self.config_manager.config.get('output', {})
     
     def update_setting(self, section: str, key: str, value: Any) -> bool:
         """
@@ -112,8 +125,7 @@ class SettingsManager:
         Returns:
             A list of available theme names
         """
-        # Currently supported themes
-        return ["light", "dark", "system"]
+        return list(self.AVAILABLE_THEMES)
     
     def get_available_font_sizes(self) -> List[int]:
         """
@@ -122,8 +134,7 @@ class SettingsManager:
         Returns:
             A list of available font sizes
         """
-        # Common font size options
-        return [8, 9, 10, 11, 12, 14, 16, 18, 20]
+        return list(self.AVAILABLE_FONT_SIZES)
     
     def reset_to_defaults(self) -> bool:
         """
@@ -161,11 +172,9 @@ class SettingsManager:
         """
         # Validate UI settings
         if section == "ui":
-            if key == "theme" and value not in self.get_available_themes():
-                return False
-            if key == "font_size" and not isinstance(value, int):
+            if key == "theme" and (not isinstance(value, str) or value not in self.THEME_SET):
                 return False
-            if key == "font_size" and value not in self.get_available_font_sizes():
+            if key == "font_size" and (not isinstance(value, int) or value not in self.FONT_SIZE_SET):
                 return False
                 
         # Validate path settings
@@ -187,13 +196,7 @@ class SettingsManager:
         Returns:
             True if the setting is a path setting, False otherwise
         """
-        path_settings = {
-            "database": ["path"],
-            "images": ["question_images_dir", "answer_images_dir"],
-            "output": ["worksheets_dir"]
-        }
-        
-        return section in path_settings and key in path_settings[section]
+        return key in self.PATH_SETTINGS.get(section, ())
     
     def _handle_path_update(self, section: str, key: str, value: Any) -> None:
         """
@@ -206,10 +209,13 @@ class SettingsManager:
             key: The configuration key
             value: The new path value
         """
+        if value in self._ensured_dirs:
+            return
+        
         # Create the directory if it doesn't exist
         try:
-            import os
             os.makedirs(value, exist_ok=True)
+            self._ensured_dirs.add(value)
             self.logger.info(f"Created directory for updated path setting: {value}")
         except Exception as e:
             self.logger.error(f"Error creating directory for path setting: {str(e)}")
\ No newline at end of file
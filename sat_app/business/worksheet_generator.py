@@ -8,8 +8,9 @@ This module is responsible for:
 - Preparing data for rendering in both preview and PDF generation
 """
 import random
+from collections import OrderedDict
 from typing import List, Dict, Any, Optional, Tuple
-from copy import deepcopy
+from copy import copy
 from datetime import datetime
 
 from ..dal.repositories import QuestionRepository, WorksheetRepository
@@ -26,6 +27,12 @@ class WorksheetGenerator:
     the mapping to the correct answers.
     """
     
+    # Correct answers that can be relocated when answer choices are shuffled
+    VALID_ANSWERS = frozenset('ABCD')
+    
+    # Number of questions kept between worksheet generations
+    QUESTION_CACHE_SIZE = 256
+    
     def __init__(self, question_repository: QuestionRepository, 
                  worksheet_repository: Optional[WorksheetRepository] = None):
         """
@@ -38,6 +45,14 @@ class WorksheetGenerator:
         self.logger = get_logger(__name__)
         self.question_repository = question_repository
         self.worksheet_repository = worksheet_repository
+        
+        # Dedicated generator for all shuffling; can be replaced with a seeded one
+        self._rng = random.Random()
+        
+        # Questions by ID as loaded from the repository, cleared whenever its
+        # data version changes; callers only ever get copies
+        self._question_cache: OrderedDict = OrderedDict()
+        self._cache_version = question_repository.data_version
     
     def generate_worksheet(self, worksheet: Worksheet, randomize_questions: bool = True,
                           randomize_answers: bool = True) -> Dict[str, Any]:
@@ -69,9 +84,9 @@ class WorksheetGenerator:
             if randomize_questions:
                 self._randomize_question_order(questions)
             
-            # Randomize answer choices if requested
+            # Randomize answer choices if requested and any question can be shuffled
             answer_key = None
-            if randomize_answers:
+            if randomize_answers and any(self._can_shuffle_answers(q) for q in questions):
                 answer_key = self._randomize_answer_choices(questions)
             else:
                 # If not randomizing answers, create a standard answer key
@@ -161,15 +176,11 @@ class WorksheetGenerator:
             if count <= 0:
                 raise ValueError("Question count must be greater than zero")
             
-            # Get questions matching the filters
-            questions = self.question_repository.filter_questions(filters)
+            # Pick up to count random questions matching the filters in the database
+            questions = self.question_repository.sample_questions(filters, count)
             
             if not questions:
                 raise ValueError(f"No questions found matching the provided filters: {filters}")
-            
-            # Randomize the selection if we have more questions than needed
-            if len(questions) > count:
-                questions = random.sample(questions, count)
                 
             # Use the generate_from_questions method to create the worksheet
             return self.generate_from_questions(
@@ -192,16 +203,31 @@ class WorksheetGenerator:
             question_ids: List of question IDs
         
         Returns:
-            List of Question objects
+            List of Question objects, in the order of question_ids
         """
-        questions = []
+        version = self.question_repository.data_version
+        if version != self._cache_version:
+            self._question_cache.clear()
+            self._cache_version = version
+        
+        # Fetch the questions not already cached with one query per chunk of IDs
+        missing_ids = [qid for qid in question_ids if qid not in self._question_cache]
+        if missing_ids:
+            self._question_cache.update(self.question_repository.get_questions_by_ids(missing_ids))
         
+        questions = []
         for qid in question_ids:
-            question = self.question_repository.get_question(qid)
-            if question:
-                questions.append(question)
-            else:
+            question = self._question_cache.get(qid)
+            if not question:
                 self.logger.warning(f"Question with ID {qid} not found")
+                continue
+            
+            # Answer shuffling works in place, so every occurrence gets its own copy
+            self._question_cache.move_to_end(qid)
+            questions.append(copy(question))
+        
+        while len(self._question_cache) > self.QUESTION_CACHE_SIZE:
+            self._question_cache.popitem(last=False)
         
         return questions
     
@@ -212,81 +238,70 @@ class WorksheetGenerator:
         Args:
             questions: List of Question objects to randomize
         """
-        random.shuffle(questions)
+        self._rng.shuffle(questions)
         self.logger.debug("Randomized question order")
     
     def _randomize_answer_choices(self, questions: List[Question]) -> Dict[str, str]:
         """
         Randomize answer choices for each question while preserving the correct answer.
         
+        The questions are updated in place.
+        
         Args:
             questions: List of Question objects to process
         
         Returns:
             Dictionary mapping question IDs to their new correct answer choices
         """
-        answer_key = {}
-        
         for question in questions:
-            # Make a deep copy of the question to avoid modifying the original
-            q = deepcopy(question)
-            
-            # Skip answer shuffling for free response questions
-            if getattr(q, 'question_type', 'multiple_choice') == 'free_response':
-                # For free response questions, just store the correct answer as-is
-                answer_key[str(q.question_id)] = q.correct_answer
-                continue
-            
-            # For multiple choice questions, validate correct_answer format
-            if not q.correct_answer or q.correct_answer not in ['A', 'B', 'C', 'D']:
-                # Skip shuffling if correct_answer is invalid
-                answer_key[str(q.question_id)] = q.correct_answer
+            # Free response questions and invalid correct answers are left as-is
+            if not self._can_shuffle_answers(question):
                 continue
             
             # Extract answer choices and corresponding images
             choices = [
-                ('A', q.answer_a, q.answer_image_a),
-                ('B', q.answer_b, q.answer_image_b),
-                ('C', q.answer_c, q.answer_image_c),
-                ('D', q.answer_d, q.answer_image_d)
+                ('A', question.answer_a, question.answer_image_a),
+                ('B', question.answer_b, question.answer_image_b),
+                ('C', question.answer_c, question.answer_image_c),
+                ('D', question.answer_d, question.answer_image_d)
             ]
             
             # Remember which choice is correct
-            correct_index = ord(q.correct_answer) - ord('A')
+            correct_index = ord(question.correct_answer) - ord('A')
             correct_choice = choices[correct_index]
             
             # Shuffle all choices
-            random.shuffle(choices)
+            self._rng.shuffle(choices)
             
             # Update the question with the shuffled choices
-            q.answer_a, q.answer_image_a = choices[0][1], choices[0][2]
-            q.answer_b, q.answer_image_b = choices[1][1], choices[1][2]
-            q.answer_c, q.answer_image_c = choices[2][1], choices[2][2]
-            q.answer_d, q.answer_image_d = choices[3][1], choices[3][2]
-            
-            # Find the new position of the correct answer
-            for i, (letter, _, _) in enumerate(choices):
-                if (letter, choices[i][1], choices[i][2]) == correct_choice:
-                    q.correct_answer = chr(i + ord('A'))
-                    break
+            question.answer_a, question.answer_image_a = choices[0][1], choices[0][2]
+            question.answer_b, question.answer_image_b = choices[1][1], choices[1][2]
+            question.answer_c, question.answer_image_c = choices[2][1], choices[2][2]
+            question.answer_d, question.answer_image_d = choices[3][1], choices[3][2]
             
-            # Store the new correct answer in the answer key
-            answer_key[str(q.question_id)] = q.correct_answer
-            
-            # Replace the original question with the shuffled version
-            question.answer_a = q.answer_a
-            question.answer_b = q.answer_b
-            question.answer_c = q.answer_c
-            question.answer_d = q.answer_d
-            question.answer_image_a = q.answer_image_a
-            question.answer_image_b = q.answer_image_b
-            question.answer_image_c = q.answer_image_c
-            question.answer_image_d = q.answer_image_d
-            question.correct_answer = q.correct_answer
+            # Find the new position of the correct answer; the original letter
+            # makes every choice tuple distinct
+            question.correct_answer = chr(choices.index(correct_choice) + ord('A'))
+        
+        # Build the answer key from the updated correct answers in one pass
+        answer_key = {str(q.question_id): q.correct_answer for q in questions}
         
         self.logger.debug("Randomized answer choices and created answer key")
         return answer_key
     
+    def _can_shuffle_answers(self, question: Question) -> bool:
+        """
+        Check whether a question's answer choices can be shuffled.
+        
+        Args:
+            question: The Question to check
+        
+        Returns:
+            True for non-free-response questions whose correct answer is A-D
+        """
+        return (getattr(question, 'question_type', 'multiple_choice') != 'free_response'
+                and question.correct_answer in self.VALID_ANSWERS)
+    
     def prepare_for_preview(self, worksheet_data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
         Prepare worksheet data for live preview display.
@@ -301,23 +316,19 @@ class WorksheetGenerator:
         questions = worksheet_data.get('questions', [])
         
         for i, question in enumerate(questions):
+            question_type = getattr(question, 'question_type', 'multiple_choice')
             preview_question = {
                 'number': i + 1,
                 'id': question.question_id,
                 'text': question.question_text,
                 'image_path': question.question_image_path,
-                'question_type': getattr(question, 'question_type', 'multiple_choice'),
+                'question_type': question_type,
                 'correct_answer': question.correct_answer
             }
             
             # Only include answer choices for multiple choice questions
-            if getattr(question, 'question_type', 'multiple_choice') == 'multiple_choice':
-                preview_question['answers'] = [
-                    {'letter': 'A', 'text': question.answer_a, 'image_path': question.answer_image_a},
-                    {'letter': 'B', 'text': question.answer_b, 'image_path': question.answer_image_b},
-                    {'letter': 'C', 'text': question.answer_c, 'image_path': question.answer_image_c},
-                    {'letter': 'D', 'text': question.answer_d, 'image_path': question.answer_image_d}
-                ]
+            if question_type == 'multiple_choice':
+                preview_question['answers'] = self._format_answer_choices(question)
             else:
                 # For free response questions, no predefined answers
                 preview_question['answers'] = []
@@ -326,6 +337,23 @@ class WorksheetGenerator:
         
         return preview_data
     
+    def _format_answer_choices(self, question: Question) -> List[Dict[str, Any]]:
+        """
+        Format a multiple choice question's answers for preview or PDF rendering.
+        
+        Args:
+            question: The Question to format
+        
+        Returns:
+            List of answer dictionaries with letter, text and image path
+        """
+        return [
+            {'letter': 'A', 'text': question.answer_a, 'image_path': question.answer_image_a},
+            {'letter': 'B', 'text': question.answer_b, 'image_path': question.answer_image_b},
+            {'letter': 'C', 'text': question.answer_c, 'image_path': question.answer_image_c},
+            {'letter': 'D', 'text': question.answer_d, 'image_path': question.answer_image_d}
+        ]
+    
     def save_worksheet(self, worksheet: Worksheet, pdf_path: Optional[str] = None) -> Optional[int]:
         """
         Save the worksheet to the database.
@@ -375,10 +403,10 @@ class WorksheetGenerator:
         questions = worksheet_data.get('questions', [])
         answer_key = worksheet_data.get('answer_key', {})
         
-        # Save the worksheet to the database
-        if worksheet and self.worksheet_repository:
+        # Save the worksheet to the database unless an earlier export already did
+        if worksheet and self.worksheet_repository and not worksheet.worksheet_id:
             worksheet_id = self.save_worksheet(worksheet)
-            if worksheet_id and worksheet_id != worksheet.worksheet_id:
+            if worksheet_id:
                 worksheet.worksheet_id = worksheet_id
         
         pdf_data = {
@@ -392,22 +420,18 @@ class WorksheetGenerator:
         
         # Format questions for PDF rendering
         for i, question in enumerate(questions):
+            question_type = getattr(question, 'question_type', 'multiple_choice')
             pdf_question = {
                 'number': i + 1,
                 'id': question.question_id,
                 'text': question.question_text,
                 'image_path': question.question_image_path,
-                'question_type': getattr(question, 'question_type', 'multiple_choice')
+                'question_type': question_type
             }
             
             # Only include answer choices for multiple choice questions
-            if getattr(question, 'question_type', 'multiple_choice') == 'multiple_choice':
-                pdf_question['answers'] = [
-                    {'letter': 'A', 'text': question.answer_a, 'image_path': question.answer_image_a},
-                    {'letter': 'B', 'text': question.answer_b, 'image_path': question.answer_image_b},
-                    {'letter': 'C', 'text': question.answer_c, 'image_path': question.answer_image_c},
-                    {'letter': 'D', 'text': question.answer_d, 'image_path': question.answer_image_d}
-                ]
+            if question_type == 'multiple_choice':
+                pdf_question['answers'] = self._format_answer_choices(question)
             else:
                 # For free response questions, no predefined answers but provide space for writing
                 pdf_question['answers'] = []
@@ -5,7 +5,7 @@ Manages connections to the SQLite database and database initialization.
 import os
 import sqlite3
 import logging
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, Iterator, Tuple
 
 
 class DatabaseManager:
@@ -16,6 +16,19 @@ class DatabaseManager:
     and provides utility methods for common database operations.
     """
     
+    # Size of the connection's compiled statement cache, keyed by SQL text.
+    # Queries issued with the same string skip SQLite's parse and prepare step.
+    CACHED_STATEMENTS = 256
+    
+    # Applied to every new connection after WAL journaling is enabled: temp
+    # tables and sorts stay in memory, reads go through a 256 MiB memory map,
+    # and the page cache is raised to 64 MiB (negative sizes are in KiB)
+    CONNECTION_PRAGMAS = (
+        "PRAGMA temp_store = MEMORY",
+        "PRAGMA mmap_size = 268435456",
+        "PRAGMA cache_size = -65536",
+    )
+    
     def __init__(self, db_path: str):
         """
         Initialize the DatabaseManager.
@@ -43,6 +56,7 @@ class DatabaseManager:
             
             # Connect to the database
             self.conn = self._get_connection()
+            self._configure_connection()
             
             # Create tables
             self._create_tables()
@@ -60,10 +74,33 @@ class DatabaseManager:
         Returns:
             A SQLite connection object
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = sqlite3.connect(self.db_path, cached_statements=self.CACHED_STATEMENTS)
         conn.row_factory = sqlite3.Row  # This allows accessing columns by name
         return conn
     
+    def _configure_connection(self) -> None:
+        """
+        Switch the database to WAL journaling and apply CONNECTION_PRAGMAS.
+        
+        In WAL mode commits use synchronous=NORMAL, which skips the fsync on
+        every commit: committed data survives an application crash but the
+        last transactions may be lost on power failure or OS crash. WAL keeps
+        two companion files next to the database (-wal and -shm); copy all
+        three, or close the application first, when backing up the database.
+        If WAL cannot be enabled the default journal and sync settings are kept.
+        """
+        try:
+            mode = self.conn.execute("PRAGMA journal_mode = WAL").fetchone()[0]
+            if str(mode).lower() == 'wal':
+                self.conn.execute("PRAGMA synchronous = NORMAL")
+            else:
+                self.logger.warning(f"Could not enable WAL journaling, using {mode}")
+            
+            for pragma in self.CONNECTION_PRAGMAS:
+                self.conn.execute(pragma)
+        except sqlite3.Error as e:
+            self.logger.warning(f"Could not configure database connection: {str(e)}")
+    
     def _create_tables(self) -> None:
         """
         Create database tables if they don't exist.
@@ -89,6 +126,7 @@ class DatabaseManager:
             question_type TEXT DEFAULT 'multiple_choice',
             subject_tags TEXT,
             difficulty_label TEXT,
+            signature_cache TEXT,
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         )
@@ -105,6 +143,15 @@ class DatabaseManager:
         # Migration: Remove NOT NULL constraints from answer columns for free response support
         self._migrate_answer_columns(cursor)
         
+        # Add signature_cache column if it doesn't exist (migration for existing databases).
+        # It holds the normalized duplicate-detection signature, filled lazily on import.
+        try:
+            cursor.execute("ALTER TABLE questions ADD COLUMN signature_cache TEXT")
+            self.conn.commit()
+        except sqlite3.OperationalError:
+            # Column already exists
+            pass
+        
         # Update correct_answer column to allow TEXT instead of CHAR(1) for free response
         # Note: SQLite doesn't have a direct way to modify column types, but since CHAR(1) 
         # is just a hint in SQLite and stored as TEXT anyway, no migration is needed
@@ -153,8 +200,52 @@ class DatabaseManager:
         )
         ''')
         
+        # Indexes for the scoring lookups; the per-student queries are served by the
+        # leading student_id column of the first two
+        cursor.execute("CREATE INDEX IF NOT EXISTS ix_scores_student_ts ON scores (student_id, timestamp)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS ix_scores_sw ON scores (student_id, worksheet_id, question_id, correct)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS ix_scores_question ON scores (question_id)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS ix_scores_worksheet ON scores (worksheet_id)")
+        
+        self._create_question_counter(cursor)
+        
         self.conn.commit()
     
+    def _create_question_counter(self, cursor) -> None:
+        """
+        Maintain the number of questions in the meta table.
+        
+        Triggers keep the 'question_count' row in step with every insert and
+        delete, inside the same transaction, so the total can be read without
+        scanning the questions table. The row is recounted on every start in
+        case the table was rebuilt (the migration above drops its triggers).
+        """
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS meta (
+            key TEXT PRIMARY KEY,
+            value INTEGER
+        )
+        ''')
+        
+        cursor.execute('''
+        INSERT OR REPLACE INTO meta (key, value)
+        SELECT 'question_count', COUNT(*) FROM questions
+        ''')
+        
+        cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS questions_count_insert AFTER INSERT ON questions
+        BEGIN
+            UPDATE meta SET value = value + 1 WHERE key = 'question_count';
+        END
+        ''')
+        
+        cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS questions_count_delete AFTER DELETE ON questions
+        BEGIN
+            UPDATE meta SET value = value - 1 WHERE key = 'question_count';
+        END
+        ''')
+    
     def _migrate_answer_columns(self, cursor) -> None:
         """
         Migrate existing tables to remove NOT NULL constraints from answer columns.
@@ -196,6 +287,7 @@ class DatabaseManager:
                     question_type TEXT DEFAULT 'multiple_choice',
                     subject_tags TEXT,
                     difficulty_label TEXT,
+                    signature_cache TEXT,
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 )
@@ -253,10 +345,130 @@ class DatabaseManager:
             self.conn.rollback()
             return None
     
+    def execute_query_tuples(self, query: str, params: Tuple = ()) -> Optional[List[Tuple]]:
+        """
+        Execute a SELECT query and return plain tuples instead of dictionaries.
+        
+        Cheaper than execute_query on large result sets when the caller
+        unpacks columns by position in the order the query selects them.
+        
+        Args:
+            query: The SQL query to execute
+            params: Parameters for the SQL query
+        
+        Returns:
+            A list of rows as tuples, or None if an error occurred
+        """
+        try:
+            cursor = self.conn.cursor()
+            cursor.row_factory = None
+            cursor.execute(query, params)
+            return cursor.fetchall()
+        except Exception as e:
+            self.logger.error(f"Query execution error: {str(e)}")
+            self.logger.error(f"Query: {query}, Params: {params}")
+            return None
+    
+    def iter_query(self, query: str, params: Tuple = ()) -> Iterator[sqlite3.Row]:
+        """
+        Execute a SELECT query and yield rows from the cursor as they are read.
+        
+        Unlike execute_query, the result set is never materialized as a list, so
+        callers that aggregate in a single pass only hold one row at a time.
+        
+        Args:
+            query: The SQL query to execute
+            params: Parameters for the SQL query
+        
+        Returns:
+            An iterator over the rows; it stops early if an error occurs
+        """
+        try:
+            cursor = self.conn.cursor()
+            cursor.execute(query, params)
+            yield from cursor
+        except Exception as e:
+            self.logger.error(f"Query execution error: {str(e)}")
+            self.logger.error(f"Query: {query}, Params: {params}")
+    
+    def execute_insert(self, query: str, params: Tuple = ()) -> Optional[int]:
+        """
+        Execute and commit a single INSERT statement.
+        
+        Args:
+            query: The INSERT statement to execute
+            params: Parameters for the SQL statement
+        
+        Returns:
+            The rowid of the inserted row, or None if an error occurred
+        """
+        try:
+            cursor = self.conn.cursor()
+            cursor.execute(query, params)
+            self.conn.commit()
+            return cursor.lastrowid
+        except Exception as e:
+            self.logger.error(f"Query execution error: {str(e)}")
+            self.logger.error(f"Query: {query}, Params: {params}")
+            self.conn.rollback()
+            return None
+    
+    def execute_write(self, query: str, params: Tuple = ()) -> Optional[int]:
+        """
+        Execute and commit a single INSERT, UPDATE or DELETE statement.
+        
+        Args:
+            query: The SQL statement to execute
+            params: Parameters for the SQL statement
+        
+        Returns:
+            The number of rows the statement changed, or None if an error occurred
+        """
+        try:
+            cursor = self.conn.cursor()
+            cursor.execute(query, params)
+            self.conn.commit()
+            return cursor.rowcount
+        except Exception as e:
+            self.logger.error(f"Query execution error: {str(e)}")
+            self.logger.error(f"Query: {query}, Params: {params}")
+            self.conn.rollback()
+            return None
+    
+    def execute_many(self, query: str, params_list: List[Tuple]) -> bool:
+        """
+        Execute a SQL statement once for each parameter tuple in a single transaction.
+        
+        Args:
+            query: The SQL statement to execute
+            params_list: Parameter tuples, one per execution
+        
+        Returns:
+            True if all executions were committed, False if an error occurred
+            and the transaction was rolled back
+        """
+        try:
+            cursor = self.conn.cursor()
+            cursor.executemany(query, params_list)
+            self.conn.commit()
+            return True
+        except Exception as e:
+            self.logger.error(f"Batch execution error: {str(e)}")
+            self.logger.error(f"Query: {query}, Rows: {len(params_list)}")
+            self.conn.rollback()
+            return False
+    
     def close(self) -> None:
         """
         Close the database connection.
+        
+        Lets SQLite refresh its query planner statistics first, which
+        it only does for tables whose contents changed noticeably.
         """
         if self.conn:
+            try:
+                self.conn.execute("PRAGMA optimize")
+            except sqlite3.Error as e:
+                self.logger.warning(f"Could not optimize database: {str(e)}")
             self.conn.close()
             self.conn = None
\ No newline at end of file
@@ -4,7 +4,7 @@ Implements CRUD operations for data models.
 """
 import json
 import logging
-from typing import List, Optional, Dict, Any, Tuple
+from typing import List, Optional, Dict, Any, Iterator, Tuple
 
 from .database_manager import DatabaseManager
 from .models import Question, Worksheet, Score
@@ -17,6 +17,22 @@ class QuestionRepository:
     Implements CRUD operations for the Question model.
     """
     
+    INSERT_QUERY = '''
+    INSERT INTO questions (
+        question_text, question_image_path,
+        answer_a, answer_b, answer_c, answer_d,
+        answer_image_a, answer_image_b, answer_image_c, answer_image_d,
+        correct_answer, answer_explanation, subject_tags, difficulty_label
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    '''
+    
+    # Fixed queries for the two common single-criterion filters
+    FIND_BY_TAG_QUERY = "SELECT * FROM questions WHERE subject_tags LIKE ? ORDER BY question_id"
+    FIND_BY_DIFFICULTY_QUERY = "SELECT * FROM questions WHERE difficulty_label = ? ORDER BY question_id"
+    
+    # Older SQLite builds allow at most 999 bound parameters per statement
+    MAX_QUERY_PARAMETERS = 900
+    
     def __init__(self, db_manager: DatabaseManager):
         """
         Initialize the QuestionRepository.
@@ -26,6 +42,8 @@ class QuestionRepository:
         """
         self.logger = logging.getLogger(__name__)
         self.db_manager = db_manager
+        # Incremented on every successful write so callers can tell when cached reads are stale
+        self.data_version = 0
     
     def add_question(self, question: Question) -> Optional[int]:
         """
@@ -38,31 +56,147 @@ class QuestionRepository:
             The ID of the added question, or None if an error occurred
         """
         try:
-            query = '''
-            INSERT INTO questions (
-                question_text, question_image_path,
-                answer_a, answer_b, answer_c, answer_d,
-                answer_image_a, answer_image_b, answer_image_c, answer_image_d,
-                correct_answer, answer_explanation, subject_tags, difficulty_label
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            '''
+            return self._insert(self._insert_params(question))
             
-            params = (
-                question.question_text, question.question_image_path,
-                question.answer_a, question.answer_b, question.answer_c, question.answer_d,
-                question.answer_image_a, question.answer_image_b, question.answer_image_c, question.answer_image_d,
-                question.correct_answer, question.answer_explanation, ','.join(question.subject_tags), question.difficulty_label
-            )
+        except Exception as e:
+            self.logger.error(f"Error adding question: {str(e)}")
+            return None
+    
+    def add_question_dict(self, data: Dict[str, Any]) -> Optional[int]:
+        """
+        Add a question to the database straight from validated question data.
+        
+        Binds the dictionary values directly instead of building a Question first.
+        
+        Args:
+            data: Dictionary containing question data
+        
+        Returns:
+            The ID of the added question, or None if an error occurred
+        """
+        try:
+            return self._insert(self._insert_params_from_dict(data))
             
-            self.db_manager.execute_query(query, params)
+        except Exception as e:
+            self.logger.error(f"Error adding question: {str(e)}")
+            return None
+    
+    def add_question_dicts(self, items: List[Dict[str, Any]]) -> List[int]:
+        """
+        Add several questions straight from validated question data in a single transaction.
+        
+        Args:
+            items: Dictionaries containing question data
+        
+        Returns:
+            The IDs of the added questions in input order; an empty list if an
+            error occurred, in which case none of the questions are added
+        """
+        if not items:
+            return []
+        
+        try:
+            params_list = [self._insert_params_from_dict(data) for data in items]
             
-            # Get the ID of the inserted question
+            if not self.db_manager.execute_many(self.INSERT_QUERY, params_list):
+                return []
+            self.data_version += 1
+            
+            # One transaction on a single connection assigns consecutive IDs,
+            # so the batch ends at the connection's last inserted rowid
             result = self.db_manager.execute_query("SELECT last_insert_rowid() as id")
-            return result[0]['id'] if result else None
+            if not result:
+                return []
+            
+            last_id = result[0]['id']
+            return list(range(last_id - len(params_list) + 1, last_id + 1))
             
         except Exception as e:
-            self.logger.error(f"Error adding question: {str(e)}")
-            return None
+            self.logger.error(f"Error adding questions: {str(e)}")
+            return []
+    
+    def _insert_params_from_dict(self, data: Dict[str, Any]) -> Tuple:
+        """
+        Build the INSERT_QUERY parameters from question data.
+        
+        Missing fields get the same defaults as Question.from_dict.
+        
+        Args:
+            data: Dictionary containing question data
+        
+        Returns:
+            Tuple of column values in INSERT_QUERY order
+        """
+        subject_tags = data.get('subject_tags', [])
+        if isinstance(subject_tags, str):
+            subject_tags = [tag.strip() for tag in subject_tags.split(',') if tag.strip()]
+        
+        return (
+            data.get('question_text', ''), data.get('question_image_path'),
+            data.get('answer_a', ''), data.get('answer_b', ''), data.get('answer_c', ''), data.get('answer_d', ''),
+            data.get('answer_image_a'), data.get('answer_image_b'), data.get('answer_image_c'), data.get('answer_image_d'),
+            data.get('correct_answer', ''), data.get('answer_explanation', ''), ','.join(subject_tags), data.get('difficulty_label', '')
+        )
+    
+    def _insert(self, params: Tuple) -> Optional[int]:
+        """
+        Run INSERT_QUERY with the given parameters.
+        
+        Args:
+            params: Tuple of column values in INSERT_QUERY order
+        
+        Returns:
+            The ID of the added question, or None if an error occurred
+        """
+        question_id = self.db_manager.execute_insert(self.INSERT_QUERY, params)
+        if question_id is not None:
+            self.data_version += 1
+        
+        return question_id
+    
+    def add_questions(self, questions: List[Question]) -> int:
+        """
+        Add several questions to the database in a single transaction.
+        
+        Args:
+            questions: The Questions to add
+        
+        Returns:
+            The number of questions added; 0 if an error occurred, in which
+            case none of the questions are added
+        """
+        if not questions:
+            return 0
+        
+        try:
+            params_list = [self._insert_params(question) for question in questions]
+            
+            if not self.db_manager.execute_many(self.INSERT_QUERY, params_list):
+                return 0
+            self.data_version += 1
+            
+            return len(params_list)
+            
+        except Exception as e:
+            self.logger.error(f"Error adding questions: {str(e)}")
+            return 0
+    
+    def _insert_params(self, question: Question) -> Tuple:
+        """
+        Build the INSERT_QUERY parameters for a question.
+        
+        Args:
+            question: The Question to insert
+        
+        Returns:
+            Tuple of column values in INSERT_QUERY order
+        """
+        return (
+            question.question_text, question.question_image_path,
+            question.answer_a, question.answer_b, question.answer_c, question.answer_d,
+            question.answer_image_a, question.answer_image_b, question.answer_image_c, question.answer_image_d,
+            question.correct_answer, question.answer_explanation, ','.join(question.subject_tags), question.difficulty_label
+        )
     
     def get_question(self, question_id: int) -> Optional[Question]:
         """
@@ -87,15 +221,49 @@ class QuestionRepository:
             self.logger.error(f"Error getting question: {str(e)}")
             return None
     
+    def get_questions_by_ids(self, question_ids: List[int]) -> Dict[int, Question]:
+        """
+        Get several questions by ID with as few queries as possible.
+        
+        Args:
+            question_ids: The IDs of the questions to get
+        
+        Returns:
+            A dictionary mapping each found question ID to its Question;
+            IDs that do not exist are left out
+        """
+        try:
+            questions = {}
+            unique_ids = list(dict.fromkeys(question_ids))
+            
+            # Stay below SQLite's limit on the number of bound parameters
+            for start in range(0, len(unique_ids), self.MAX_QUERY_PARAMETERS):
+                chunk = unique_ids[start:start + self.MAX_QUERY_PARAMETERS]
+                placeholders = ', '.join('?' for _ in chunk)
+                query = f"SELECT * FROM questions WHERE question_id IN ({placeholders})"
+                result = self.db_manager.execute_query(query, tuple(chunk))
+                
+                for row in result or []:
+                    question = Question.from_dict(row)
+                    questions[question.question_id] = question
+            
+            return questions
+            
+        except Exception as e:
+            self.logger.error(f"Error getting questions by IDs: {str(e)}")
+            return {}
+    
     def update_question(self, question: Question) -> bool:
         """
         Update a question.
         
+        The original created_at timestamp is left untouched.
+        
         Args:
             question: The Question to update
         
         Returns:
-            True if the update was successful, False otherwise
+            True if successful, False otherwise
         """
         try:
             query = '''
@@ -104,7 +272,7 @@ class QuestionRepository:
                 answer_a = ?, answer_b = ?, answer_c = ?, answer_d = ?,
                 answer_image_a = ?, answer_image_b = ?, answer_image_c = ?, answer_image_d = ?,
                 correct_answer = ?, answer_explanation = ?, subject_tags = ?, difficulty_label = ?,
-                updated_at = CURRENT_TIMESTAMP
+                signature_cache = NULL, updated_at = CURRENT_TIMESTAMP
             WHERE question_id = ?
             '''
             
@@ -116,8 +284,11 @@ class QuestionRepository:
                 question.question_id
             )
             
-            result = self.db_manager.execute_query(query, params)
-            return result is not None
+            rowcount = self.db_manager.execute_write(query, params)
+            if rowcount:
+                self.data_version += 1
+            
+            return rowcount is not None
             
         except Exception as e:
             self.logger.error(f"Error updating question: {str(e)}")
@@ -131,12 +302,15 @@ class QuestionRepository:
             question_id: The ID of the question to delete
         
         Returns:
-            True if the deletion was successful, False otherwise
+            True if successful, False otherwise
         """
         try:
             query = "DELETE FROM questions WHERE question_id = ?"
-            result = self.db_manager.execute_query(query, (question_id,))
-            return result is not None
+            rowcount = self.db_manager.execute_write(query, (question_id,))
+            if rowcount:
+                self.data_version += 1
+            
+            return rowcount is not None
             
         except Exception as e:
             self.logger.error(f"Error deleting question: {str(e)}")
@@ -154,14 +328,52 @@ class QuestionRepository:
             A list of Questions with pagination applied
         """
         try:
-            query = "SELECT * FROM questions ORDER BY question_id"
+            params = []
+            query = self._add_pagination("SELECT * FROM questions ORDER BY question_id", params, limit, offset)
             
-            # Add pagination if specified
-            if limit is not None:
-                query += f" LIMIT {limit}"
-                if offset is not None:
-                    query += f" OFFSET {offset}"
+            result = self.db_manager.execute_query(query, tuple(params))
             
+            if not result:
+                return []
+            
+            return [Question.from_dict(row) for row in result]
+            
+        except Exception as e:
+            self.logger.error(f"Error getting all questions: {str(e)}")
+            return []
+    
+    def get_cached_signatures(self) -> List[str]:
+        """
+        Get the cached duplicate-detection signatures of all questions.
+        
+        Questions whose signature has not been computed yet, or was cleared
+        by an update, are not included (see get_questions_without_signature).
+        
+        Returns:
+            A list of signatures
+        """
+        try:
+            query = "SELECT signature_cache FROM questions WHERE signature_cache IS NOT NULL ORDER BY question_id"
+            result = self.db_manager.execute_query(query)
+            
+            if not result:
+                return []
+            
+            return [row['signature_cache'] for row in result]
+            
+        except Exception as e:
+            self.logger.error(f"Error getting cached signatures: {str(e)}")
+            return []
+    
+    def get_questions_without_signature(self) -> List[Question]:
+        """
+        Get all questions that have no cached duplicate-detection signature.
+        
+        Returns:
+            A list of Questions
+        """
+        try:
+            query = "SELECT * FROM questions WHERE signature_cache IS NULL ORDER BY question_id"
             result = self.db_manager.execute_query(query)
             
             if not result:
@@ -170,18 +382,48 @@ class QuestionRepository:
             return [Question.from_dict(row) for row in result]
             
         except Exception as e:
-            self.logger.error(f"Error getting all questions: {str(e)}")
+            self.logger.error(f"Error getting questions without signature: {str(e)}")
             return []
     
-    def count_all_questions(self) -> int:
+    def update_signatures(self, signatures: List[Tuple[int, str]]) -> bool:
+        """
+        Store duplicate-detection signatures in a single transaction.
+        
+        Args:
+            signatures: List of (question_id, signature) pairs
+        
+        Returns:
+            True if the update was successful, False otherwise
+        """
+        if not signatures:
+            return True
+        
+        try:
+            query = "UPDATE questions SET signature_cache = ? WHERE question_id = ?"
+            params_list = [(signature, question_id) for question_id, signature in signatures]
+            return self.db_manager.execute_many(query, params_list)
+            
+        except Exception as e:
+            self.logger.error(f"Error updating signatures: {str(e)}")
+            return False
+    
+    def count_all_questions(self, approximate: bool = False) -> int:
         """
         Count all questions in the database.
         
+        Args:
+            approximate: Read the trigger-maintained counter from the meta table
+                instead of scanning the questions table; the counter is only
+                recounted when the database is opened
+        
         Returns:
             Total number of questions
         """
         try:
-            query = "SELECT COUNT(*) as count FROM questions"
+            if approximate:
+                query = "SELECT value as count FROM meta WHERE key = 'question_count'"
+            else:
+                query = "SELECT COUNT(*) as count FROM questions"
             result = self.db_manager.execute_query(query)
             
             if not result:
@@ -233,6 +475,31 @@ class QuestionRepository:
         
         return conditions, params
     
+    def _add_pagination(self, query: str, params: List, limit: Optional[int], offset: Optional[int]) -> str:
+        """
+        Append LIMIT/OFFSET clauses as bound parameters.
+        
+        Binding the values instead of formatting them into the SQL keeps the
+        statement text identical across pages, so SQLite reuses the compiled statement.
+        
+        Args:
+            query: The query to paginate
+            params: Query parameters, extended in place
+            limit: Maximum number of rows to return, or None for no limit
+            offset: Number of rows to skip; only applied together with a limit
+        
+        Returns:
+            The query with pagination clauses added
+        """
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(int(limit))
+            if offset is not None:
+                query += " OFFSET ?"
+                params.append(int(offset))
+        
+        return query
+    
     def filter_questions(self, filters: Dict[str, Any], limit: Optional[int] = None, offset: Optional[int] = None) -> List[Question]:
         """
         Filter questions based on criteria with pagination support.
@@ -254,12 +521,7 @@ class QuestionRepository:
                 query += " WHERE " + " AND ".join(conditions)
             
             query += " ORDER BY question_id"
-            
-            # Add pagination if specified
-            if limit is not None:
-                query += f" LIMIT {limit}"
-                if offset is not None:
-                    query += f" OFFSET {offset}"
+            query = self._add_pagination(query, params, limit, offset)
             
             # Execute the query
             result = self.db_manager.execute_query(query, tuple(params))
@@ -273,6 +535,103 @@ class QuestionRepository:
             self.logger.error(f"Error filtering questions: {str(e)}")
             return []
     
+    def sample_questions(self, filters: Dict[str, Any], count: int) -> List[Question]:
+        """
+        Pick random questions matching the filters.
+        
+        Only the IDs are shuffled in SQL; full rows are loaded for the picked
+        questions alone.
+        
+        Args:
+            filters: Dictionary of filter criteria, as for filter_questions
+            count: Maximum number of questions to return
+        
+        Returns:
+            Up to count matching Questions, in question ID order
+        """
+        try:
+            conditions, params = self._build_filter_conditions(filters)
+            
+            query = "SELECT question_id FROM questions"
+            if conditions:
+                query += " WHERE " + " AND ".join(conditions)
+            
+            query += " ORDER BY RANDOM() LIMIT ?"
+            params.append(count)
+            
+            result = self.db_manager.execute_query_tuples(query, tuple(params))
+            
+            if not result:
+                return []
+            
+            question_ids = sorted(row[0] for row in result)
+            questions_by_id = self.get_questions_by_ids(question_ids)
+            return [questions_by_id[qid] for qid in question_ids if qid in questions_by_id]
+            
+        except Exception as e:
+            self.logger.error(f"Error sampling questions: {str(e)}")
+            return []
+    
+    def find_by_tag(self, tag: str, limit: Optional[int] = None, offset: Optional[int] = None) -> List[Question]:
+        """
+        Get questions with a subject tag, without going through the general filter builder.
+        
+        Matches the same rows as filter_questions({'subject_tags': tag}).
+        
+        Args:
+            tag: The subject tag to filter by
+            limit: Maximum number of questions to return
+            offset: Number of questions to skip
+        
+        Returns:
+            A list of Questions with the given tag
+        """
+        return self._find(self.FIND_BY_TAG_QUERY, f"%{tag}%", limit, offset)
+    
+    def find_by_difficulty(self, difficulty: str, limit: Optional[int] = None, offset: Optional[int] = None) -> List[Question]:
+        """
+        Get questions with a difficulty level, without going through the general filter builder.
+        
+        Matches the same rows as filter_questions({'difficulty': difficulty}).
+        
+        Args:
+            difficulty: The difficulty level to filter by
+            limit: Maximum number of questions to return
+            offset: Number of questions to skip
+        
+        Returns:
+            A list of Questions with the given difficulty
+        """
+        return self._find(self.FIND_BY_DIFFICULTY_QUERY, difficulty, limit, offset)
+    
+    def _find(self, query: str, value: Any, limit: Optional[int], offset: Optional[int]) -> List[Question]:
+        """
+        Run a single-parameter question query with optional pagination.
+        
+        Args:
+            query: The query, with one placeholder
+            value: The value bound to the placeholder
+            limit: Maximum number of questions to return
+            offset: Number of questions to skip
+        
+        Returns:
+            A list of matching Questions
+        """
+        try:
+            params = [value]
+            query = self._add_pagination(query, params, limit, offset)
+            
+            result = self.db_manager.execute_query(query, tuple(params))
+            
+            if not result:
+                return []
+            
+            return [Question.from_dict(row) for row in result]
+            
+        except Exception as e:
+            self.logger.error(f"Error finding questions: {str(e)}")
+            return []
+    
     def count_filtered_questions(self, filters: Dict[str, Any]) -> int:
         """
         Count questions matching the filter criteria.
@@ -320,6 +679,10 @@ class WorksheetRepository:
         """
         self.logger = logging.getLogger(__name__)
         self.db_manager = db_manager
+        
+        # Incremented on every successful write so callers can tell when
+        # cached worksheet data is stale
+        self.data_version = 0
     
     def add_worksheet(self, worksheet: Worksheet) -> Optional[int]:
         """
@@ -345,6 +708,7 @@ class WorksheetRepository:
             )
             
             self.db_manager.execute_query(query, params)
+            self.data_version += 1
             
             # Get the ID of the inserted worksheet
             result = self.db_manager.execute_query("SELECT last_insert_rowid() as id")
@@ -403,6 +767,8 @@ class WorksheetRepository:
             )
             
             result = self.db_manager.execute_query(query, params)
+            if result is not None:
+                self.data_version += 1
             return result is not None
             
         except Exception as e:
@@ -422,6 +788,8 @@ class WorksheetRepository:
         try:
             query = "DELETE FROM worksheets WHERE worksheet_id = ?"
             result = self.db_manager.execute_query(query, (worksheet_id,))
+            if result is not None:
+                self.data_version += 1
             return result is not None
             
         except Exception as e:
@@ -456,6 +824,23 @@ class ScoreRepository:
     Implements CRUD operations for the Score model.
     """
     
+    # Shared by add_score and add_scores
+    INSERT_QUERY = '''
+    INSERT INTO scores (student_id, worksheet_id, question_id, correct)
+    VALUES (?, ?, ?, ?)
+    '''
+    
+    # A student's scores with the question fields analytics group by, newest first
+    STUDENT_SCORES_WITH_QUESTIONS_QUERY = '''
+    SELECT s.question_id, s.worksheet_id, s.correct,
+           q.question_id IS NOT NULL AS has_question,
+           q.difficulty_label, q.subject_tags
+    FROM scores s
+    LEFT JOIN questions q ON q.question_id = s.question_id
+    WHERE s.student_id = ?
+    ORDER BY s.timestamp DESC, s.score_id DESC
+    '''
+    
     def __init__(self, db_manager: DatabaseManager):
         """
         Initialize the ScoreRepository.
@@ -465,6 +850,8 @@ class ScoreRepository:
         """
         self.logger = logging.getLogger(__name__)
         self.db_manager = db_manager
+        # Incremented on every successful write so callers can tell when cached analytics are stale
+        self.data_version = 0
     
     def add_score(self, score: Score) -> Optional[int]:
         """
@@ -477,11 +864,6 @@ class ScoreRepository:
             The ID of the added score, or None if an error occurred
         """
         try:
-            query = '''
-            INSERT INTO scores (student_id, worksheet_id, question_id, correct)
-            VALUES (?, ?, ?, ?)
-            '''
-            
             params = (
                 score.student_id,
                 score.worksheet_id,
@@ -489,16 +871,69 @@ class ScoreRepository:
                 1 if score.correct else 0
             )
             
-            self.db_manager.execute_query(query, params)
+            score_id = self.db_manager.execute_insert(self.INSERT_QUERY, params)
+            if score_id is not None:
+                self.data_version += 1
             
-            # Get the ID of the inserted score
-            result = self.db_manager.execute_query("SELECT last_insert_rowid() as id")
-            return result[0]['id'] if result else None
+            return score_id
             
         except Exception as e:
             self.logger.error(f"Error adding score: {str(e)}")
             return None
     
+    def add_scores(self, scores: List[Score]) -> int:
+        """
+        Add several scores to the database in a single transaction.
+        
+        Args:
+            scores: The Scores to add
+        
+        Returns:
+            The number of scores added; 0 if an error occurred, in which
+            case none of the scores are added
+        """
+        if not scores:
+            return 0
+        
+        try:
+            params_list = [
+                (score.student_id, score.worksheet_id, score.question_id, 1 if score.correct else 0)
+                for score in scores
+            ]
+            
+            if not self.db_manager.execute_many(self.INSERT_QUERY, params_list):
+                return 0
+            self.data_version += 1
+            
+            return len(params_list)
+            
+        except Exception as e:
+            self.logger.error(f"Error adding scores: {str(e)}")
+            return 0
+    
+    def delete_student_worksheet_scores(self, student_id: str, worksheet_id: int) -> bool:
+        """
+        Delete all of a student's scores for a worksheet.
+        
+        Args:
+            student_id: The ID of the student
+            worksheet_id: The ID of the worksheet
+        
+        Returns:
+            True if the deletion was successful, False otherwise
+        """
+        try:
+            query = "DELETE FROM scores WHERE student_id = ? AND worksheet_id = ?"
+            if self.db_manager.execute_write(query, (student_id, worksheet_id)) is None:
+                return False
+            
+            self.data_version += 1
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"Error deleting student worksheet scores: {str(e)}")
+            return False
+    
     def get_scores_by_student(self, student_id: str) -> List[Score]:
         """
         Get scores for a student.
@@ -522,6 +957,47 @@ class ScoreRepository:
             self.logger.error(f"Error getting scores by student: {str(e)}")
             return []
     
+    def get_student_scores_with_questions(self, student_id: str) -> List[Dict[str, Any]]:
+        """
+        Get a student's scores joined with the question fields analytics need.
+        
+        Args:
+            student_id: The ID of the student
+        
+        Returns:
+            A list of dictionaries with 'question_id', 'worksheet_id', 'correct',
+            'has_question', 'difficulty_label' and 'subject_tags' (a list), newest
+            first; the question fields are None when the question no longer exists
+        """
+        return list(self.iter_student_scores_with_questions(student_id))
+    
+    def iter_student_scores_with_questions(self, student_id: str) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over a student's scores joined with their question fields.
+        
+        Rows are read from the cursor one at a time, for callers that only
+        aggregate them.
+        
+        Args:
+            student_id: The ID of the student
+        
+        Returns:
+            An iterator over the same dictionaries get_student_scores_with_questions returns
+        """
+        try:
+            for row in self.db_manager.iter_query(self.STUDENT_SCORES_WITH_QUESTIONS_QUERY, (student_id,)):
+                row = dict(row)
+                
+                # Split the stored tags the same way Question.from_dict does
+                subject_tags = row['subject_tags']
+                if subject_tags is not None:
+                    row['subject_tags'] = [tag.strip() for tag in subject_tags.split(',') if tag.strip()]
+                
+                yield row
+                
+        except Exception as e:
+            self.logger.error(f"Error getting student scores with questions: {str(e)}")
+    
     def get_scores_by_worksheet(self, worksheet_id: int) -> List[Score]:
         """
         Get scores for a worksheet.
@@ -545,6 +1021,138 @@ class ScoreRepository:
             self.logger.error(f"Error getting scores by worksheet: {str(e)}")
             return []
     
+    def get_score_summary(self, question_id: Optional[int] = None) -> Dict[str, int]:
+        """
+        Count scores with SQL aggregates instead of loading them.
+        
+        Args:
+            question_id: Only count scores for this question; None counts all scores
+        
+        Returns:
+            Dictionary with 'total', 'correct' and 'students' (distinct student) counts;
+            all zero if there are no scores or an error occurred
+        """
+        try:
+            query = """
+            SELECT COUNT(*) AS total,
+                   COALESCE(SUM(CASE WHEN correct THEN 1 ELSE 0 END), 0) AS correct,
+                   COUNT(DISTINCT student_id) AS students
+            FROM scores
+            """
+            params = ()
+            if question_id is not None:
+                query += " WHERE question_id = ?"
+                params = (question_id,)
+            
+            result = self.db_manager.execute_query(query, params)
+            
+            if not result:
+                return {'total': 0, 'correct': 0, 'students': 0}
+            
+            return result[0]
+            
+        except Exception as e:
+            self.logger.error(f"Error getting score summary: {str(e)}")
+            return {'total': 0, 'correct': 0, 'students': 0}
+    
+    def get_worksheet_student_summaries(self, worksheet_id: int) -> List[Dict[str, Any]]:
+        """
+        Count each student's scores on a worksheet with a single grouped query.
+        
+        Args:
+            worksheet_id: The ID of the worksheet
+        
+        Returns:
+            A list of dictionaries with 'student_id', 'total' and 'correct',
+            ordered by student ID
+        """
+        try:
+            query = """
+            SELECT student_id, COUNT(*) AS total,
+                   SUM(CASE WHEN correct THEN 1 ELSE 0 END) AS correct
+            FROM scores
+            WHERE worksheet_id = ?
+            GROUP BY student_id
+            ORDER BY student_id
+            """
+            result = self.db_manager.execute_query(query, (worksheet_id,))
+            
+            return result or []
+            
+        except Exception as e:
+            self.logger.error(f"Error getting worksheet student summaries: {str(e)}")
+            return []
+    
+    def get_question_success_extremes(self, limit: int, hardest: bool = True) -> List[Dict[str, Any]]:
+        """
+        Get the questions with the lowest or highest success rate.
+        
+        Questions with equal rates are ordered by when they were first answered.
+        
+        Args:
+            limit: Maximum number of questions to return
+            hardest: True for the lowest success rates, False for the highest
+        
+        Returns:
+            A list of dictionaries with 'question_id', 'total' and 'correct', in
+            ascending order of success rate
+        """
+        try:
+            direction = "ASC" if hardest else "DESC"
+            query = f"""
+            SELECT question_id, COUNT(*) AS total,
+                   SUM(CASE WHEN correct THEN 1 ELSE 0 END) AS correct
+            FROM scores
+            GROUP BY question_id
+            ORDER BY (SUM(CASE WHEN correct THEN 1 ELSE 0 END) * 1.0 / COUNT(*)) * 100.0 {direction},
+                     MIN(score_id) {direction}
+            LIMIT ?
+            """
+            result = self.db_manager.execute_query(query, (limit,))
+            
+            if not result:
+                return []
+            
+            return result if hardest else result[::-1]
+            
+        except Exception as e:
+            self.logger.error(f"Error getting question success rates: {str(e)}")
+            return []
+    
+    def get_daily_performance(self, student_id: str, days: int = 30) -> List[Dict[str, Any]]:
+        """
+        Count a student's scores per calendar day with a single grouped query.
+        
+        Args:
+            student_id: The ID of the student
+            days: Maximum number of most recent days (that have scores) to return
+        
+        Returns:
+            A list of dictionaries with 'day' (YYYY-MM-DD), 'total' and 'correct',
+            in ascending date order
+        """
+        try:
+            query = """
+            SELECT date(timestamp) AS day, COUNT(*) AS total,
+                   SUM(CASE WHEN correct THEN 1 ELSE 0 END) AS correct
+            FROM scores
+            WHERE student_id = ?
+            GROUP BY day
+            ORDER BY day DESC
+            LIMIT ?
+            """
+            result = self.db_manager.execute_query(query, (student_id, days))
+            
+            if not result:
+                return []
+            
+            result.reverse()
+            return result
+            
+        except Exception as e:
+            self.logger.error(f"Error getting daily performance: {str(e)}")
+            return []
+    
     def get_student_question_score(self, student_id: str, question_id: int) -> Optional[Score]:
         """
         Get a student's score for a specific question.
@@ -240,7 +240,7 @@ class ImportExportView(QWidget):
             self,
             "Select JSON File",
             "",
-            "JSON Files (*.json);;All Files (*)"
+            "JSON Files (*.json);;NDJSON Files (*.ndjson *.jsonl);;All Files (*)"
         )
         
         if file_path:
@@ -253,12 +253,12 @@ class ImportExportView(QWidget):
             self,
             "Save JSON File",
             "",
-            "JSON Files (*.json);;All Files (*)"
+            "JSON Files (*.json);;NDJSON Files (*.ndjson *.jsonl);;All Files (*)"
         )
         
         if file_path:
-            # Ensure it has .json extension
-            if not file_path.lower().endswith('.json'):
+            # Ensure it has a .json (or NDJSON) extension
+            if not file_path.lower().endswith(('.json', '.ndjson', '.jsonl')):
                 file_path += '.json'
             
             self.export_path_edit.setText(file_path)
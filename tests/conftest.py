@@ -0,0 +1,48 @@
+"""
+Shared fixtures for the SAT Question Bank tests.
+"""
+import pytest
+
+from sat_app.dal.database_manager import DatabaseManager
+from sat_app.dal.repositories import QuestionRepository, ScoreRepository, WorksheetRepository
+
+
+@pytest.fixture
+def db_manager(tmp_path):
+    """An initialized database in a temporary directory."""
+    manager = DatabaseManager(str(tmp_path / "sat_app.db"))
+    assert manager.initialize()
+    yield manager
+    manager.close()
+
+
+@pytest.fixture
+def question_repository(db_manager):
+    return QuestionRepository(db_manager)
+
+
+@pytest.fixture
+def score_repository(db_manager):
+    return ScoreRepository(db_manager)
+
+
+@pytest.fixture
+def worksheet_repository(db_manager):
+    return WorksheetRepository(db_manager)
+
+
+@pytest.fixture
+def make_question_data():
+    """Factory for valid question dictionaries."""
+    def make(text: str, **overrides):
+        data = {
+            "question_text": text,
+            "answer_a": "1",
+            "answer_b": "2",
+            "answer_c": "3",
+            "answer_d": "4",
+            "correct_answer": "A",
+        }
+        data.update(overrides)
+        return data
+    return make
@@ -0,0 +1,180 @@
+"""
+Tests for importing questions from JSON and NDJSON files.
+"""
+import json
+
+import pytest
+
+from sat_app.business import import_export_manager
+from sat_app.business.import_export_manager import ImportExportManager
+
+INVALID_FORMAT_MESSAGE = "Invalid import format: missing 'questions' array"
+
+QUESTION_TEXTS = [
+    "What is the value of x if 3x + 5 = 20?",
+    "Which word best describes the narrator's tone in the passage?",
+    "A circle has a radius of 4. What is its circumference?",
+    "The author mentions the lighthouse primarily to illustrate what idea?",
+    "How many integers between 10 and 50 are divisible by 7?",
+    "Which choice most logically completes the text about coral reefs?",
+]
+
+
+@pytest.fixture(params=["ijson", "orjson", "json"])
+def reader(request, monkeypatch):
+    """Run a test with each way of reading JSON import files."""
+    if request.param == "ijson":
+        pytest.importorskip("ijson")
+        # Stream every file, whatever the backend and file size
+        monkeypatch.setattr(import_export_manager, "HAS_IJSON", True)
+        monkeypatch.setattr(import_export_manager, "HAS_FAST_IJSON", True)
+    else:
+        monkeypatch.setattr(import_export_manager, "HAS_IJSON", False)
+        monkeypatch.setattr(import_export_manager, "HAS_FAST_IJSON", False)
+        if request.param == "orjson":
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr(import_export_manager, "HAS_ORJSON", False)
+    return request.param
+
+
+@pytest.fixture
+def manager(question_repository, tmp_path):
+    manager = ImportExportManager(question_repository, str(tmp_path / "images"))
+    # Small batches so a malformed file spans several of them
+    manager.IMPORT_BATCH_SIZE = 2
+    return manager
+
+
+@pytest.fixture
+def questions(make_question_data):
+    return [make_question_data(text) for text in QUESTION_TEXTS]
+
+
+def test_import_valid_file(reader, manager, question_repository, questions, tmp_path):
+    import_path = tmp_path / "questions.json"
+    import_path.write_text(json.dumps({"metadata": {"version": "1.0"}, "questions": questions}))
+
+    success, message, stats = manager.import_questions(str(import_path))
+
+    assert success, message
+    assert stats["imported"] == len(questions)
+    assert question_repository.count_all_questions() == len(questions)
+
+
+def test_import_skips_duplicates_within_file(reader, manager, question_repository, questions, tmp_path):
+    import_path = tmp_path / "questions.json"
+    import_path.write_text(json.dumps({"questions": questions + questions[:2]}))
+
+    success, message, stats = manager.import_questions(str(import_path))
+
+    assert success, message
+    assert stats["imported"] == len(questions)
+    assert stats["duplicates"] == 2
+    assert question_repository.count_all_questions() == len(questions)
+
+
+@pytest.mark.parametrize("content", [
+    '{"questions": {"question_text": "Not a list"}}',
+    '{"questions": null}',
+    '{"questions": "text"}',
+    '{"metadata": {"version": "1.0"}}',
+    '[{"question_text": "No wrapper object"}]',
+])
+def test_import_rejects_missing_questions_array(reader, manager, question_repository, tmp_path, content):
+    import_path = tmp_path / "questions.json"
+    import_path.write_text(content)
+
+    success, message, stats = manager.import_questions(str(import_path))
+
+    assert not success
+    assert message == INVALID_FORMAT_MESSAGE
+    assert stats["imported"] == 0
+    assert question_repository.count_all_questions() == 0
+
+
+def test_import_malformed_file_imports_nothing(reader, manager, question_repository, questions, tmp_path):
+    # Several batches of valid questions come before the syntax error
+    valid = ",".join(json.dumps(question) for question in questions)
+    import_path = tmp_path / "questions.json"
+    import_path.write_text('{"questions": [' + valid + ', {"question_text": }]}')
+
+    success, message, stats = manager.import_questions(str(import_path))
+
+    assert not success
+    assert message.startswith("Error during import:")
+    assert stats["imported"] == 0
+    assert question_repository.count_all_questions() == 0
+    assert not (tmp_path / "images").exists()
+
+
+def test_import_ndjson(manager, question_repository, questions, tmp_path):
+    lines = [json.dumps({"metadata": {"version": "1.0"}})]
+    lines.extend(json.dumps(question) for question in questions)
+    import_path = tmp_path / "questions.ndjson"
+    import_path.write_text("\n".join(lines) + "\n\n")
+
+    success, message, stats = manager.import_questions(str(import_path))
+
+    assert success, message
+    assert stats["imported"] == len(questions)
+    assert question_repository.count_all_questions() == len(questions)
+
+
+def test_import_malformed_ndjson_imports_nothing(manager, question_repository, questions, tmp_path):
+    lines = [json.dumps(question) for question in questions]
+    lines.append('{"question_text": ')
+    import_path = tmp_path / "questions.ndjson"
+    import_path.write_text("\n".join(lines) + "\n")
+
+    success, message, stats = manager.import_questions(str(import_path))
+
+    assert not success
+    assert f"line {len(lines)}" in message
+    assert stats["imported"] == 0
+    assert question_repository.count_all_questions() == 0
+
+
+def test_failed_question_is_not_a_duplicate_source(manager, question_repository, questions,
+                                                   monkeypatch, tmp_path):
+    # The first question cannot be added, so its repeat later in the file is
+    # an error again rather than a duplicate of a question that was never added
+    failing_text = questions[0]["question_text"]
+    add_questions = question_repository.add_questions
+    add_question = question_repository.add_question
+    monkeypatch.setattr(
+        question_repository, "add_questions",
+        lambda batch: 0 if any(q.question_text == failing_text for q in batch) else add_questions(batch)
+    )
+    monkeypatch.setattr(
+        question_repository, "add_question",
+        lambda question: None if question.question_text == failing_text else add_question(question)
+    )
+    manager.IMPORT_BATCH_SIZE = 1
+    import_path = tmp_path / "questions.json"
+    import_path.write_text(json.dumps({"questions": questions + questions[:1]}))
+
+    success, message, stats = manager.import_questions(str(import_path))
+
+    assert success, message
+    assert stats["imported"] == len(questions) - 1
+    assert stats["errors"] == 2
+    assert stats["duplicates"] == 0
+
+
+def test_export_import_round_trip(manager, question_repository, questions, tmp_path, db_manager):
+    for question in questions:
+        assert question_repository.add_question_dict(question)
+    export_path = tmp_path / "export" / "questions.ndjson"
+
+    success, message = manager.export_all_questions(str(export_path))
+    assert success, message
+
+    lines = export_path.read_text().splitlines()
+    assert len(lines) == len(questions) + 1
+    assert [json.loads(line)["question_text"] for line in lines[1:]] == QUESTION_TEXTS
+
+    # Everything exported is already in the bank
+    success, message, stats = manager.import_questions(str(export_path))
+    assert success, message
+    assert stats["duplicates"] == len(questions)
@@ -0,0 +1,93 @@
+"""
+Tests for QuestionManager writes and its read caches.
+"""
+import pytest
+
+from sat_app.business.question_manager import QuestionManager
+
+
+@pytest.fixture
+def manager(question_repository):
+    return QuestionManager(question_repository)
+
+
+@pytest.fixture
+def question_id(manager, make_question_data):
+    return manager.create_question(make_question_data("What is 2 + 2?", subject_tags=["Math"]))
+
+
+def test_create_invalidates_caches(manager, question_id, make_question_data):
+    assert manager.count_all_questions() == 1
+    assert [q.question_id for q in manager.get_all_questions()] == [question_id]
+    assert len(manager.filter_questions({"text_search": "What"})) == 1
+
+    new_id = manager.create_question(make_question_data("What is 3 + 3?"))
+
+    assert manager.count_all_questions() == 2
+    assert [q.question_id for q in manager.get_all_questions()] == [question_id, new_id]
+    assert len(manager.filter_questions({"text_search": "What"})) == 2
+
+
+def test_create_questions_invalidates_caches(manager, question_id, make_question_data):
+    assert manager.count_all_questions() == 1
+
+    new_ids = manager.create_questions([
+        make_question_data("What is 3 + 3?"),
+        make_question_data("What is 4 + 4?"),
+    ])
+
+    assert len(new_ids) == 2
+    assert manager.count_all_questions() == 3
+    assert len(manager.get_all_questions()) == 3
+
+
+def test_update_invalidates_caches(manager, question_id, make_question_data):
+    assert manager.get_question(question_id).question_text == "What is 2 + 2?"
+    assert manager.get_all_questions()[0].question_text == "What is 2 + 2?"
+
+    assert manager.update_question(question_id, make_question_data("What is 5 + 5?"))
+
+    assert manager.get_question(question_id).question_text == "What is 5 + 5?"
+    assert manager.get_all_questions()[0].question_text == "What is 5 + 5?"
+    assert manager.filter_questions({"text_search": "2 + 2"}) == []
+
+
+def test_delete_invalidates_caches(manager, question_id):
+    assert manager.get_question(question_id) is not None
+    assert manager.count_all_questions() == 1
+    assert len(manager.get_all_questions()) == 1
+
+    assert manager.delete_question(question_id)
+
+    assert manager.get_question(question_id) is None
+    assert manager.count_all_questions() == 0
+    assert manager.get_all_questions() == []
+
+
+def test_cached_questions_are_copies(manager, question_id):
+    question = manager.get_question(question_id)
+    question.question_text = "Changed"
+    question.subject_tags.append("Changed")
+    listed = manager.get_all_questions()[0]
+    listed.question_text = "Changed"
+    listed.subject_tags.append("Changed")
+
+    assert manager.get_question(question_id).question_text == "What is 2 + 2?"
+    assert manager.get_question(question_id).subject_tags == ["Math"]
+    assert manager.get_all_questions()[0].question_text == "What is 2 + 2?"
+    assert manager.get_all_questions()[0].subject_tags == ["Math"]
+
+
+def test_update_missing_question_raises_before_validation(manager):
+    with pytest.raises(KeyError):
+        manager.update_question(999, {})
+
+
+def test_update_invalid_data_raises_value_error(manager, question_id):
+    with pytest.raises(ValueError):
+        manager.update_question(question_id, {})
+
+
+def test_delete_missing_question_raises(manager):
+    with pytest.raises(KeyError):
+        manager.delete_question(999)
@@ -0,0 +1,249 @@
+"""
+Tests for ScoringService analytics.
+
+The analytics are aggregated in SQL and NumPy. These tests compare them with
+a straightforward Python aggregation over the raw score rows, which is how
+ScoringService originally computed them.
+"""
+import random
+import statistics
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+import pytest
+
+from sat_app.business.scorer import ScoringService
+from sat_app.dal.models import Question
+
+STUDENTS = ["alice", "bob", "carol", "dave"]
+SUBJECTS = ["Math", "Algebra", "Reading", "Geometry"]
+DIFFICULTIES = ["Easy", "Medium", "Hard", ""]
+
+# Scores may reference a question that has since been deleted
+MISSING_QUESTION_ID = 999
+
+
+@pytest.fixture
+def scores(db_manager, question_repository):
+    """Random questions and score rows spread over more than 30 days."""
+    rnd = random.Random(1234)
+    question_ids = []
+    for i in range(20):
+        question_ids.append(question_repository.add_question(Question(
+            question_text=f"Question {i}",
+            answer_a="1", answer_b="2", answer_c="3", answer_d="4",
+            correct_answer="A",
+            subject_tags=rnd.sample(SUBJECTS, rnd.randint(0, 2)),
+            difficulty_label=rnd.choice(DIFFICULTIES),
+        )))
+
+    start = datetime(2024, 1, 1)
+    rows = []
+    for _ in range(500):
+        timestamp = start + timedelta(days=rnd.randint(0, 45), seconds=rnd.randint(0, 86399))
+        rows.append((
+            rnd.choice(STUDENTS),
+            rnd.randint(1, 5),
+            rnd.choice(question_ids + [MISSING_QUESTION_ID]),
+            rnd.random() < 0.6,
+            timestamp.strftime("%Y-%m-%d %H:%M:%S"),
+        ))
+    assert db_manager.execute_many(
+        "INSERT INTO scores (student_id, worksheet_id, question_id, correct, timestamp) VALUES (?, ?, ?, ?, ?)",
+        rows
+    )
+    return rows
+
+
+@pytest.fixture
+def service(score_repository, question_repository, worksheet_repository):
+    return ScoringService(score_repository, question_repository, worksheet_repository)
+
+
+def _rounded(value):
+    """Round floats in nested results so they compare regardless of summation order."""
+    if isinstance(value, dict):
+        return {key: _rounded(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_rounded(item) for item in value]
+    if isinstance(value, float):
+        return round(value, 9)
+    return value
+
+
+def _percentage(results):
+    return (sum(results) / len(results)) * 100 if results else 0
+
+
+def _summary(results):
+    return {"correct": sum(results), "total": len(results), "percentage": _percentage(results)}
+
+
+def _mastery_level(percentage):
+    if percentage >= 90:
+        return "Expert"
+    if percentage >= 75:
+        return "Proficient"
+    if percentage >= 60:
+        return "Competent"
+    if percentage >= 40:
+        return "Developing"
+    return "Needs Improvement"
+
+
+def expected_student_performance(rows, questions, student_id):
+    student_rows = [row for row in rows if row[0] == student_id]
+    by_subject = defaultdict(list)
+    by_difficulty = defaultdict(list)
+    by_day = defaultdict(list)
+    for _, _, question_id, correct, timestamp in student_rows:
+        question = questions.get(question_id)
+        if question is not None:
+            for tag in question.subject_tags:
+                by_subject[tag].append(correct)
+            by_difficulty[question.difficulty_label or "Unspecified"].append(correct)
+        by_day[timestamp[:10]].append(correct)
+
+    recent = [dict(_summary(results), date=day) for day, results in sorted(by_day.items())]
+    return {
+        "student_id": student_id,
+        "total_questions": len(student_rows),
+        "total_correct": sum(row[3] for row in student_rows),
+        "percentage_correct": _percentage([row[3] for row in student_rows]),
+        "worksheets_completed": len({row[1] for row in student_rows}),
+        "subject_performance": {tag: _summary(results) for tag, results in by_subject.items()},
+        "difficulty_performance": {label: _summary(results) for label, results in by_difficulty.items()},
+        "recent_performance": recent[-30:],
+    }
+
+
+def expected_mastery_levels(rows, questions, student_id):
+    by_subject = defaultdict(list)
+    for row_student, _, question_id, correct, _ in rows:
+        if row_student == student_id and question_id in questions:
+            for tag in questions[question_id].subject_tags:
+                by_subject[tag].append(correct)
+
+    mastery_levels = {}
+    for tag, results in by_subject.items():
+        percentage = _percentage(results)
+        mastery_levels[tag] = {
+            "percentage": percentage,
+            "level": _mastery_level(percentage),
+            "questions_attempted": len(results),
+            "questions_correct": sum(results),
+        }
+    return {"student_id": student_id, "mastery_levels": mastery_levels}
+
+
+def expected_question_performance(rows, question_id):
+    question_rows = [row for row in rows if row[2] == question_id]
+    return {
+        "question_id": question_id,
+        "total_attempts": len(question_rows),
+        "correct_attempts": sum(row[3] for row in question_rows),
+        "success_rate": _percentage([row[3] for row in question_rows]),
+        "student_count": len({row[0] for row in question_rows}),
+    }
+
+
+def expected_worksheet_performance(rows, worksheet_id):
+    by_student = defaultdict(list)
+    for student_id, row_worksheet, _, correct, _ in rows:
+        if row_worksheet == worksheet_id:
+            by_student[student_id].append(correct)
+
+    performances = [
+        {
+            "student_id": student_id,
+            "total_questions": len(results),
+            "correct_answers": sum(results),
+            "percentage": _percentage(results),
+        }
+        for student_id, results in sorted(by_student.items())
+    ]
+    return {
+        "worksheet_id": worksheet_id,
+        "total_attempts": len(performances),
+        "average_score": statistics.mean(p["percentage"] for p in performances) if performances else 0,
+        "student_count": len(performances),
+        "student_performances": performances,
+    }
+
+
+@pytest.fixture
+def questions(question_repository):
+    return {question.question_id: question for question in question_repository.get_all_questions()}
+
+
+@pytest.mark.parametrize("student_id", STUDENTS + ["nobody"])
+def test_student_performance_matches_python_aggregation(service, scores, questions, student_id):
+    result = service.calculate_student_performance(student_id)
+    expected = expected_student_performance(scores, questions, student_id)
+
+    assert _rounded(result) == _rounded(expected)
+
+
+@pytest.mark.parametrize("student_id", STUDENTS + ["nobody"])
+def test_mastery_levels_match_python_aggregation(service, scores, questions, student_id):
+    result = service.get_mastery_levels(student_id)
+
+    assert _rounded(result) == _rounded(expected_mastery_levels(scores, questions, student_id))
+
+
+def test_question_performance_matches_python_aggregation(service, scores, questions):
+    for question_id in list(questions) + [MISSING_QUESTION_ID, 0]:
+        result = service.calculate_question_performance(question_id)
+        assert _rounded(result) == _rounded(expected_question_performance(scores, question_id))
+
+
+@pytest.mark.parametrize("worksheet_id", [1, 2, 3, 4, 5, 6])
+def test_worksheet_performance_matches_python_aggregation(service, scores, worksheet_id):
+    result = service.calculate_worksheet_performance(worksheet_id)
+    result["student_performances"].sort(key=lambda performance: performance["student_id"])
+
+    assert _rounded(result) == _rounded(expected_worksheet_performance(scores, worksheet_id))
+
+
+def test_comparative_analytics_match_python_aggregation(service, scores):
+    result = service.get_comparative_analytics()
+
+    by_question = defaultdict(list)
+    for _, _, question_id, correct, _ in scores:
+        by_question[question_id].append(correct)
+    success_rates = {question_id: _percentage(results) for question_id, results in by_question.items()}
+    sorted_rates = sorted(success_rates.values())
+
+    assert result["total_students"] == len({row[0] for row in scores})
+    assert result["total_questions_answered"] == len(scores)
+    assert result["average_score"] == pytest.approx(_percentage([row[3] for row in scores]))
+    for key, expected_rates in (("difficult_questions", sorted_rates[:5]),
+                                ("easy_questions", sorted_rates[-5:])):
+        assert [entry["success_rate"] for entry in result[key]] == pytest.approx(expected_rates)
+        for entry in result[key]:
+            assert entry["success_rate"] == pytest.approx(success_rates[entry["question_id"]])
+
+
+def test_analytics_refresh_after_answers_are_recorded(service, scores, questions):
+    before = service.calculate_student_performance("alice")
+    question_id = next(iter(questions))
+
+    assert service.record_answer("alice", 1, question_id, True)
+
+    after = service.calculate_student_performance("alice")
+    assert after["total_questions"] == before["total_questions"] + 1
+    assert after["total_correct"] == before["total_correct"] + 1
+    assert service.calculate_question_performance(question_id)["total_attempts"] == \
+        expected_question_performance(scores, question_id)["total_attempts"] + 1
+
+
+def test_analytics_refresh_after_question_update(service, question_repository, scores, questions):
+    answered = {row[2] for row in scores if row[0] == "bob"} & set(questions)
+    question = questions[min(answered)]
+    assert "Physics" not in service.get_mastery_levels("bob")["mastery_levels"]
+
+    question.subject_tags = ["Physics"]
+    assert question_repository.update_question(question)
+
+    assert "Physics" in service.get_mastery_levels("bob")["mastery_levels"]
+    assert "Physics" in service.calculate_student_performance("bob")["subject_performance"]
@@ -9,8 +9,7 @@ python -m pip install -r requirements.txt
 echo
 
 echo "Step 2: Verifying critical dependencies for new features..."
-python -c "import fuzzywuzzy; print('✓ fuzzywuzzy installed')" || { echo "✗ fuzzywuzzy missing"; exit 1; }
-python -c "import Levenshtein; print('✓ python-Levenshtein installed')" || { echo "✗ python-Levenshtein missing"; exit 1; }
+python -c "import rapidfuzz; print('✓ rapidfuzz installed')" || { echo "✗ rapidfuzz missing"; exit 1; }
 echo
 
 echo "Step 3: Testing database schema migration..."
@@ -14,7 +14,7 @@ a = Analysis(
         'PIL', 'PIL.Image', 'PIL.ImageDraw', 'PIL.JpegImagePlugin', 'PIL.PngImagePlugin',
         'PyQt6', 'PyQt6.QtCore', 'PyQt6.QtGui', 'PyQt6.QtWidgets', 'PyQt6.sip',
         'PyQt6.QtPrintSupport', 'PyQt6.QtSvg', 'PyQt6.QtNetwork',
-        'fuzzywuzzy', 'fuzzywuzzy.fuzz', 'fuzzywuzzy.process', 'Levenshtein'
+        'rapidfuzz', 'rapidfuzz.fuzz', 'rapidfuzz.process', 'rapidfuzz.utils'
     ],
     hookspath=[],
     hooksconfig={},